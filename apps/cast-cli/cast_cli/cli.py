@@ -1,9 +1,16 @@
 """Cast CLI commands."""
 
+import functools
+import io
 import json
 import logging
+import os
+import re
+import sys
 import uuid
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 from typing import Iterable
 
 import typer
@@ -19,12 +26,12 @@ from cast_core import (
     unregister_codebase,
 )
 from cast_core.filelock import cast_lock
-from cast_sync import HorizontalSync, build_ephemeral_index
-from cast_sync import CodebaseSync
-from rich.console import Console
-from rich.prompt import Prompt
-from rich.table import Table
-from ruamel.yaml import YAML
+
+from cast_cli.console import console
+
+# Heavier modules (cast_sync, rich, ruamel.yaml) are imported inside the
+# commands that need them, here and in the gdoc sub-app registered below,
+# so quick commands like `cast list` start fast.
 
 # Initialize
 app = typer.Typer(help="Cast Sync - Synchronize Markdown files across local casts")
@@ -32,18 +39,165 @@ app = typer.Typer(help="Cast Sync - Synchronize Markdown files across local cast
 cb_app = typer.Typer(help="Manage Codebases (install/list/uninstall)")
 app.add_typer(cb_app, name="codebase")
 # Subcommands (e.g., gdoc) get added at bottom to avoid circular imports.
-console = Console()
-yaml = YAML()
-yaml.preserve_quotes = True
-yaml.default_flow_style = False
-
-# Configure logging (default to WARNING, can be lowered to INFO in debug mode)
-logging.basicConfig(
-    level=logging.WARNING,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    datefmt="%Y-%m-%d %H:%M",
-)
+
+
 logger = logging.getLogger(__name__)
+_logging_configured = False
+
+
+def _configure_logging() -> None:
+    """Install the root log handler (default WARNING); only commands that log call this."""
+    global _logging_configured
+    if _logging_configured:
+        return
+    logging.basicConfig(
+        level=logging.WARNING,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        datefmt="%Y-%m-%d %H:%M",
+    )
+    _logging_configured = True
+
+
+@functools.lru_cache(maxsize=1)
+def _get_yaml():
+    """Return the shared round-trip YAML instance (ruamel is imported on first use)."""
+    from ruamel.yaml import YAML
+
+    yaml = YAML()
+    yaml.preserve_quotes = True
+    yaml.default_flow_style = False
+    return yaml
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_config(path: str, _mtime_ns: int, _size: int) -> Mapping:
+    """Parse a config file; the stat fields only key the cache (a change forces a re-parse)."""
+    from cast_core.yamlfast import load_yaml
+
+    # Config files are tiny: one read into memory, no text-stream wrapper
+    data = load_yaml(Path(path).read_bytes())
+    return MappingProxyType(data if isinstance(data, dict) else {})
+
+
+def _load_config(path: Path) -> Mapping:
+    """
+    Read a .cast/config.yaml for lookups only (read-only mapping, cached per file version).
+
+    Uses PyYAML's libyaml-backed loader with YAML 1.2 scalar rules (the dialect ruamel
+    writes); ruamel's round-trip loader is kept for the
+    write paths (init/install) where quote preservation matters.
+    """
+    st = os.stat(path)
+    return _parse_config(os.fspath(path), st.st_mtime_ns, st.st_size)
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """Write `data` to a sibling temp file and rename it over `path` (never leaves a torn file)."""
+    tmp = path.parent / f".{path.name}.casttmp"
+    tmp.write_bytes(data)
+    tmp.replace(path)
+
+
+def _dump_config(path: Path, data: dict) -> None:
+    """Write a freshly generated config (nothing to round-trip) with PyYAML's C dumper."""
+    import yaml
+
+    dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+    text = yaml.dump(
+        data, Dumper=dumper, default_flow_style=False, sort_keys=False, allow_unicode=True
+    )
+    _write_atomic(path, text.encode("utf-8"))
+
+
+_PLAIN_SCALAR_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_ .()-]*")
+_YAML_RESERVED = {"true", "false", "yes", "no", "on", "off", "y", "n", "null"}
+# Left raw by json.dumps but not allowed (or read as line breaks) inside a YAML scalar
+_YAML_UNSAFE_RE = re.compile("[\x7f-\x9f\u2028\u2029\ufeff\ufffe\uffff\ud800-\udfff]")
+
+
+def _yaml_scalar(value: str) -> str:
+    """Render a string as a YAML scalar, double-quoting it unless it is safely plain."""
+    if (
+        _PLAIN_SCALAR_RE.fullmatch(value)
+        and value == value.strip()
+        and value.lower() not in _YAML_RESERVED
+    ):
+        return value
+    # JSON string syntax is a valid YAML double-quoted scalar
+    quoted = json.dumps(value, ensure_ascii=False)
+    return _YAML_UNSAFE_RE.sub(lambda m: f"\\u{ord(m.group()):04x}", quoted)
+
+
+@functools.cache
+def _get_orjson():
+    """Return the orjson module, or None when it is not installed (looked up once)."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _json_bytes(obj, indent: bool = True) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when it is installed."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+        except TypeError:
+            pass  # e.g. non-str keys; the stdlib encoder is more permissive
+    # Same bytes as orjson: compact separators unless indenting, raw UTF-8
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False).encode("utf-8")
+    return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+
+
+def _stdout_bytes():
+    """Return stdout's binary stream (flushing pending text first), or None if it has none."""
+    buf = getattr(sys.stdout, "buffer", None)
+    if buf is not None:
+        sys.stdout.flush()
+    return buf
+
+
+def _json_object_chunks(head: dict, list_key: str, records: Iterable) -> Iterable[bytes]:
+    """
+    Yield a JSON object piecewise: the `head` keys first, then `list_key` holding
+    `records`, which are consumed lazily and encoded one per line.
+    """
+    yield b"{\n"
+    for key, value in head.items():
+        yield b"  " + _json_bytes(key, indent=False) + b": " + _json_bytes(value, indent=False) + b",\n"
+    yield b"  " + _json_bytes(list_key, indent=False) + b": ["
+    sep = b"\n    "
+    for record in records:
+        yield sep + _json_bytes(record, indent=False)
+        sep = b",\n    "
+    yield b"\n  ]\n}\n" if sep != b"\n    " else b"]\n}\n"
+
+
+def _write_chunks(chunks: Iterable[bytes]) -> None:
+    """Write encoded chunks to stdout as they are produced."""
+    out = _stdout_bytes()
+    if out is None:
+        sys.stdout.writelines(c.decode("utf-8") for c in chunks)
+        return
+    out.writelines(chunks)
+    out.flush()
+
+
+def _print_json(obj) -> None:
+    """Write indented JSON plus a newline to stdout without going through Rich."""
+    data = _json_bytes(obj)
+    out = _stdout_bytes()
+    if out is None:
+        sys.stdout.write(data.decode("utf-8") + "\n")
+        return
+    out.write(data + b"\n")
+    out.flush()
+
+
+_NAME_TRANS = str.maketrans({"/": "-", "\\": "-"})
 
 
 def _sanitize_name(name: str) -> str:
@@ -52,22 +206,40 @@ def _sanitize_name(name: str) -> str:
       - trim whitespace
       - replace path separators with hyphens
     """
-    name = (name or "").strip()
-    return name.replace("/", "-").replace("\\", "-")
+    return (name or "").strip().translate(_NAME_TRANS)
 
 
-def get_current_root() -> Path:
-    """Find the Cast root by looking for .cast/ directory."""
-    current = Path.cwd()
+@functools.cache
+def _root_for(cwd: str) -> Path:
+    """Return the Cast root for `cwd` (memoized; a miss raises and is not cached)."""
+    # Walk up using plain strings; only the hit becomes a Path.
+    cur = cwd
+    while True:
+        if os.path.isdir(os.path.join(cur, ".cast")):
+            return Path(cur)
+        parent = os.path.dirname(cur)
+        if parent == cur:
+            break
+        cur = parent
+    raise FileNotFoundError(cwd)
 
-    # Check current directory first
-    if (current / ".cast").exists():
-        return current
 
-    # Walk up to find .cast/
-    for parent in current.parents:
-        if (parent / ".cast").exists():
-            return parent
+def get_current_root() -> Path:
+    """Find the Cast root by looking for .cast/ directory (CAST_ROOT overrides the walk)."""
+    env_root = os.environ.get("CAST_ROOT")
+    if env_root:
+        env_root = os.path.expanduser(env_root)
+        if os.path.isdir(os.path.join(env_root, ".cast")):
+            return Path(env_root)
+    try:
+        root = _root_for(os.getcwd())
+        if not os.path.isdir(os.path.join(root, ".cast")):
+            # Cached root went away (e.g. removed during a long-lived process); look again.
+            _root_for.cache_clear()
+            root = _root_for(os.getcwd())
+        return root
+    except FileNotFoundError:
+        pass
 
     console.print("[red]Error: Not in a Cast root directory (no .cast/ found)[/red]")
     raise typer.Exit(2)
@@ -90,7 +262,9 @@ def install(
       • Enforces unique names and roots in the registry (replaces any duplicates).
       • If --name is provided, .cast/config.yaml is updated prior to registration.
     """
-    root = Path(path).expanduser().resolve()
+    # register_cast() canonicalises the root itself; resolving here too would
+    # walk every path component a second time.
+    root = Path(path).expanduser()
     try:
         # Optionally rename the cast prior to registration
         if name:
@@ -100,11 +274,15 @@ def install(
                     "[red]Install failed:[/red] .cast/config.yaml not found in the target root"
                 )
                 raise typer.Exit(2)
-            with open(config_path, encoding="utf-8") as f:
-                cfg = yaml.load(f) or {}
-            cfg["cast-name"] = _sanitize_name(name)
-            with open(config_path, "w", encoding="utf-8") as f:
-                yaml.dump(cfg, f)
+            yaml = _get_yaml()
+            cfg = yaml.load(config_path.read_bytes()) or {}
+            new_name = _sanitize_name(name)
+            # Leave the file (and its mtime) alone when the name is unchanged
+            if cfg.get("cast-name") != new_name:
+                cfg["cast-name"] = new_name
+                buf = io.BytesIO()
+                yaml.dump(cfg, buf)
+                _write_atomic(config_path, buf.getvalue())
 
         entry = register_cast(root)
         console.print(
@@ -125,18 +303,23 @@ def list_cmd(
     try:
         entries = list_casts()
         if json_out:
-            payload = {
-                "casts": [
-                    {"cast_id": e.cast_id, "name": e.name, "root": str(e.root)}
-                    for e in entries
-                ]
-            }
-            print(json.dumps(payload, indent=2))
+            records = ({"cast_id": e.cast_id, "name": e.name, "root": str(e.root)} for e in entries)
+            _write_chunks(_json_object_chunks({}, "casts", records))
+        elif not sys.stdout.isatty():
+            # Piped/redirected: plain tab-separated rows (same columns as the table);
+            # an empty registry is reported on stderr so stdout stays parseable
+            if not entries:
+                sys.stderr.write("No casts installed\n")
+            for e in entries:
+                cols = [e.name, e.cast_id, str(e.root)] if show_ids else [e.name, str(e.root)]
+                sys.stdout.write("\t".join(cols) + "\n")
         else:
             console.rule("[bold cyan]Installed Casts[/bold cyan]")
             if not entries:
                 console.print("[yellow]No casts installed[/yellow]")
             else:
+                from rich.table import Table
+
                 table = Table(show_header=True, header_style="bold")
                 table.add_column("Name")
                 if show_ids:
@@ -165,13 +348,18 @@ def init(
     root = Path.cwd()
     cast_dir = root / ".cast"
 
-    if cast_dir.exists():
+    if os.path.isdir(cast_dir):
         console.print("[yellow]Cast already initialized in this directory[/yellow]")
         raise typer.Exit(1)
 
     # Prompt for name if not provided
     if not name:
-        name = Prompt.ask("Enter a name for this Cast")
+        if sys.stdin.isatty():
+            from rich.prompt import Prompt
+
+            name = Prompt.ask("Enter a name for this Cast")
+        else:
+            name = input("Enter a name for this Cast: ")
 
     name = _sanitize_name(name)
     # Create directories
@@ -179,20 +367,15 @@ def init(
     cast_dir_path = root / "Cast"
     cast_dir_path.mkdir(parents=True, exist_ok=True)
 
-    # Create config
-    config = {
-        "cast-version": 1,
-        "cast-id": str(uuid.uuid4()),
-        "cast-name": name,
-    }
-
-    with open(cast_dir / "config.yaml", "w", encoding="utf-8") as f:
-        yaml.dump(config, f)
+    # Create config (fixed shape, so render it directly rather than via a YAML emitter)
+    _write_atomic(
+        cast_dir / "config.yaml",
+        f"cast-version: 1\ncast-id: {uuid.uuid4()}\ncast-name: {_yaml_scalar(name)}\n".encode(),
+    )
 
     # Create empty syncstate
     syncstate = {"version": 1, "updated_at": "", "baselines": {}}
-    with open(cast_dir / "syncstate.json", "w", encoding="utf-8") as f:
-        json.dump(syncstate, f, indent=2)
+    _write_atomic(cast_dir / "syncstate.json", _json_bytes(syncstate))
 
     console.print(f"[green][OK] Cast initialized: {name}[/green]")
     console.print(f"  Root: {root}")
@@ -221,28 +404,75 @@ def uninstall(
 ):
     """Uninstall (unregister) a Cast from the machine registry."""
     try:
-        # Try by id
-        removed = unregister_cast(cast_id=identifier)
-        if not removed:
-            # Try by name
-            removed = unregister_cast(name=identifier)
-        if not removed:
-            # Try by root path
+        # One registry read decides the match (id, then name, then root path)
+        entries = list_casts()
+        hit = next((e for e in entries if e.cast_id == identifier), None)
+        if hit is None:
+            hit = next((e for e in entries if e.name == identifier), None)
+        if hit is None:
             p = Path(identifier).expanduser()
             if p.exists():
-                removed = unregister_cast(root=p.resolve())
-
-        if not removed:
-            console.print(f"[red]Uninstall failed:[/red] No installed cast matched '{identifier}'")
-            raise typer.Exit(2)
-
-        console.print(
-            f"[green][OK][/green] Uninstalled cast: [bold]{removed.name}[/bold] (id={removed.cast_id})\n  root: {removed.root}"
-        )
+                root = p.resolve()
+                hit = next((e for e in entries if e.root == root), None)
+        removed = unregister_cast(cast_id=hit.cast_id) if hit else None
     except Exception as e:
         console.print(f"[red]Uninstall failed:[/red] {e}")
         raise typer.Exit(2) from e
 
+    if not removed:
+        console.print(f"[red]Uninstall failed:[/red] No installed cast matched '{identifier}'")
+        raise typer.Exit(2)
+
+    console.print(
+        f"[green][OK][/green] Uninstalled cast: [bold]{removed.name}[/bold] (id={removed.cast_id})\n  root: {removed.root}"
+    )
+
+
+def _rel(path: Path, base: str) -> str:
+    """`path` relative to the directory `base` as a string, or just its name outside it."""
+    ps, prefix = str(path), os.path.join(base, "")
+    return ps[len(prefix):] if ps.startswith(prefix) else path.name
+
+
+def _print_rows(columns: Iterable, rows: list[tuple]) -> None:
+    """
+    Render `rows` as a Rich table on a terminal, or as tab-separated lines when piped.
+    A column is a header string or a (header, style) pair.
+    """
+    if not sys.stdout.isatty():
+        sys.stdout.writelines("\t".join(row) + "\n" for row in rows)
+        return
+    from rich.table import Table
+
+    table = Table(show_header=True, header_style="bold")
+    for col in columns:
+        header, style = (col, None) if isinstance(col, str) else col
+        table.add_column(header, style=style)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+# Static "Details" text for the hsync debug plan; renames are rendered per plan
+_DETAILS_BY_DECISION = {
+    "pull": "peer → local",
+    "create_local": "peer → local",
+    "push": "local → peer",
+    "create_peer": "local → peer",
+    "delete_local": "deleted locally (accept peer deletion)",
+    "delete_peer": "deleted on peer (propagate local deletion)",
+    "conflict": "conflict (see resolution)",
+}
+
+# Totals line of the hsync summary; only the counts vary per run
+_SUMMARY_TMPL = (
+    "Totals: ⬇️ pulls: [bold]{pulls}[/bold]   ⬆️ pushes: [bold]{pushes}[/bold]   "
+    "➕ created: [bold]{created}[/bold]   ✂️ deletions: [bold]{deletes}[/bold]\n"
+    "        🔁 renames: [bold]{renames}[/bold]   "
+    "⚠️ conflicts (open): [bold]{conflicts_open}[/bold]   "
+    "✔️ conflicts (resolved): [bold]{conflicts_resolved}[/bold]"
+)
+
 
 @app.command()
 def hsync(
@@ -262,7 +492,10 @@ def hsync(
     ),
 ):
     """Run horizontal sync across local casts."""
+    from cast_sync import HorizontalSync
+
     # Adjust logging level based on debug flag
+    _configure_logging()
     if debug:
         logging.getLogger().setLevel(logging.INFO)
         logging.getLogger('cast_sync').setLevel(logging.INFO)
@@ -276,8 +509,7 @@ def hsync(
 
         # Check if vault exists
         config_path = root / ".cast" / "config.yaml"
-        with open(config_path, encoding="utf-8") as f:
-            config_data = yaml.load(f)
+        config_data = _load_config(config_path)
 
         vault_path = root / "Cast"
         if not vault_path.exists():
@@ -316,48 +548,26 @@ def hsync(
             plans = syncer.last_plans
             if plans:
                 console.rule("[dim]Execution Plan (debug)")
-                t = Table(show_header=True, header_style="bold")
-                t.add_column("Decision", style="dim")
-                t.add_column("Peer")
-                t.add_column("File (local)")
-                t.add_column("Details")
+                rows = []
+                vault_str = str(syncer.vault_path)
                 for p in plans:
                     # local file (relative)
-                    try:
-                        local_rel = str(p.local_path.relative_to(syncer.vault_path))
-                    except Exception:
-                        local_rel = p.local_path.name
-                    details = ""
-                    if p.decision.name.lower().startswith("rename"):
+                    local_rel = _rel(p.local_path, vault_str)
+                    details = _DETAILS_BY_DECISION.get(p.decision.value, "")
+                    if p.decision.value.startswith("rename"):
                         # show before/after
                         if p.decision.value == "rename_peer" and p.peer_path and p.rename_to:
-                            try:
-                                entry = resolve_cast_by_name(p.peer_name)
-                            except Exception:
-                                entry = None
-                            base = (p.peer_root / "Cast") if p.peer_root else None
-                            _from = str(p.peer_path.relative_to(base)) if (base and p.peer_path) else (p.peer_path.name if p.peer_path else "")
-                            _to = str(p.rename_to.relative_to(base)) if (base and p.rename_to) else (p.rename_to.name if p.rename_to else "")
+                            if p.peer_root:
+                                base = os.path.join(p.peer_root, "Cast")
+                                _from, _to = _rel(p.peer_path, base), _rel(p.rename_to, base)
+                            else:
+                                _from, _to = p.peer_path.name, p.rename_to.name
                             details = f"peer: {_from} → {_to}"
                         elif p.decision.value == "rename_local" and p.rename_to:
-                            try:
-                                _from = str(p.local_path.relative_to(syncer.vault_path))
-                                _to = str(p.rename_to.relative_to(syncer.vault_path))
-                            except Exception:
-                                _from, _to = p.local_path.name, p.rename_to.name
-                            details = f"local: {_from} → {_to}"
-                    elif p.decision.value in ("pull", "create_local"):
-                        details = "peer → local"
-                    elif p.decision.value in ("push", "create_peer"):
-                        details = "local → peer"
-                    elif p.decision.value == "delete_local":
-                        details = "deleted locally (accept peer deletion)"
-                    elif p.decision.value == "delete_peer":
-                        details = "deleted on peer (propagate local deletion)"
-                    elif p.decision.value == "conflict":
-                        details = "conflict (see resolution)"
-                    t.add_row(p.decision.value, p.peer_name, local_rel, details)
-                console.print(t)
+                            _to = _rel(p.rename_to, vault_str)
+                            details = f"local: {local_rel} → {_to}"
+                    rows.append((p.decision.value, p.peer_name, local_rel, details))
+                _print_rows((("Decision", "dim"), "Peer", "File (local)", "Details"), rows)
 
         # Render human-friendly summary
         summary = getattr(syncer, "summary", None)
@@ -373,28 +583,25 @@ def hsync(
             conflicts_open = summary.conflicts_open
             conflicts_resolved = summary.conflicts_resolved
             console.print(
-                f"Totals: ⬇️ pulls: [bold]{pulls}[/bold]   ⬆️ pushes: [bold]{pushes}[/bold]   "
-                f"➕ created: [bold]{created}[/bold]   ✂️ deletions: [bold]{deletes}[/bold]\n"
-                f"        🔁 renames: [bold]{renames}[/bold]   "
-                f"⚠️ conflicts (open): [bold]{conflicts_open}[/bold]   "
-                f"✔️ conflicts (resolved): [bold]{conflicts_resolved}[/bold]"
+                _SUMMARY_TMPL.format(
+                    pulls=pulls,
+                    pushes=pushes,
+                    created=created,
+                    deletes=deletes,
+                    renames=renames,
+                    conflicts_open=conflicts_open,
+                    conflicts_resolved=conflicts_resolved,
+                )
             )
 
-            if summary.items:
-                table = Table(show_header=True, header_style="bold")
-                table.add_column("Action")
-                table.add_column("Peer")
-                table.add_column("File")
-                table.add_column("Details")
-                for it in summary.items:
-                    # Only list actual changes and conflicts; omit pure NO_OPs
-                    action = it.action
-                    if action == "no_op":
-                        continue
-                    file_display = it.local_rel or "-"
-                    details = it.detail or ""
-                    table.add_row(action, it.peer, file_display, details)
-                console.print(table)
+            # Only list actual changes and conflicts; omit pure NO_OPs
+            rows = [
+                (it.action, it.peer, it.local_rel or "-", it.detail or "")
+                for it in summary.items
+                if it.action != "no_op"
+            ]
+            if rows:
+                _print_rows(("Action", "Peer", "File", "Details"), rows)
             else:
                 console.print("[dim]No changes.[/dim]")
 
@@ -410,33 +617,63 @@ def hsync(
         raise typer.Exit(2) from e
 
 
+def _has_markdown(folder: Path) -> bool:
+    """
+    True as soon as any *.md file is found below `folder`. Like the indexer's rglob,
+    symlinked files count but symlinked folders are not descended into.
+    """
+    stack = [os.fspath(folder)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        return True
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+        except OSError:
+            continue
+    return False
+
+
 @app.command()
 def doctor():
     """Check Cast configuration and report issues."""
+    from cast_sync import build_ephemeral_index
+    from cast_sync.index import index_cache_path
+
     try:
         root = get_current_root()
         cast_dir = root / ".cast"
+        config_path = cast_dir / "config.yaml"
+        vault_path = root / "Cast"
 
         issues = []
         warnings = []
+        entries = None
 
-        # Check config.yaml
-        config_path = cast_dir / "config.yaml"
-        if not config_path.exists():
+        # One directory scan answers every ".cast/<file> exists?" question below
+        with os.scandir(cast_dir) as it:
+            cast_files = {e.name for e in it if e.is_file()}
+
+        # Check config.yaml (loaded once; every later check uses these locals)
+        config_found = "config.yaml" in cast_files
+        if not config_found:
             issues.append("config.yaml not found")
         else:
-            with open(config_path, encoding="utf-8") as f:
-                config = yaml.load(f)
+            config = _load_config(config_path)
+            cast_id = config.get("cast-id")
+            cast_name = config.get("cast-name")
+            cast_location = config.get("cast-location")
 
-            if not config.get("cast-id"):
+            if not cast_id:
                 issues.append("cast-id missing in config.yaml")
-            if not config.get("cast-name"):
+            if not cast_name:
                 issues.append("cast-name missing in config.yaml")
 
-            vault_path = root / "Cast"
             if not vault_path.exists():
                 issues.append(f"Cast folder not found at ./Cast")
-            elif config.get("cast-location") and config.get("cast-location") != "Cast":
+            elif cast_location and cast_location != "Cast":
                 warnings.append(
                     "Deprecated 'cast-location' found in config; Casts now assume './Cast'."
                 )
@@ -444,9 +681,8 @@ def doctor():
             # Check registry installation state
             try:
                 entries = list_casts()
-                installed = any(
-                    e.cast_id == config.get("cast-id") and e.root == root for e in entries
-                )
+                hit = {e.cast_id: e for e in entries}.get(cast_id)
+                installed = hit is not None and hit.root == root
                 if not installed:
                     warnings.append(
                         "This Cast is not installed in the machine registry. Run 'cast install .'"
@@ -455,29 +691,37 @@ def doctor():
                 warnings.append(f"Could not read machine registry: {e}")
 
         # Check syncstate.json
-        syncstate_path = cast_dir / "syncstate.json"
-        if not syncstate_path.exists():
+        if "syncstate.json" not in cast_files:
             warnings.append("syncstate.json not found (will be created on first sync)")
 
-        # Validate that referenced peers are resolvable via the machine registry
+        # Validate that referenced peers are resolvable via the machine registry.
+        # A missing Cast folder is already an issue, so no issues means it exists.
+        # A vault without any Markdown has no peers to check, so skip the index walk.
         try:
-            if config_path.exists() and not issues:
-                vault_path = root / "Cast"
-                if vault_path.exists():
-                    idx = build_ephemeral_index(root, vault_path, fixup=False)
-                    for peer in sorted(idx.all_peers()):
-                        if not resolve_cast_by_name(peer):
-                            warnings.append(
-                                f"Peer '{peer}' not found in machine registry. "
-                                "Install that peer with 'cast install .' in its root."
-                            )
-                    # NEW: codebase checks
-                    for cb in sorted(idx.all_codebases()):
-                        if not resolve_codebase_by_name(cb):
-                            warnings.append(
-                                f"Codebase '{cb}' not found in machine registry. "
-                                "Install it with 'cast codebase install <path> -n {cb}'."
-                            )
+            if config_found and not issues and _has_markdown(vault_path):
+                idx = build_ephemeral_index(
+                    root, vault_path, fixup=False, cache_path=index_cache_path(root)
+                )
+                # Read the registry once and check peers against it by name
+                if entries is None:
+                    entries = list_casts()
+                by_name = {e.name: e for e in entries}
+                # Only the (usually empty) set of missing peers needs sorting
+                missing = [p for p in idx.all_peers() if p not in by_name]
+                for peer in sorted(missing):
+                    warnings.append(
+                        f"Peer '{peer}' not found in machine registry. "
+                        "Install that peer with 'cast install .' in its root."
+                    )
+                # NEW: codebase checks (one registry read, then set membership)
+                codebases = idx.all_codebases()
+                known_codebases = {cb.name for cb in list_codebases()} if codebases else set()
+                for cb in sorted(codebases):
+                    if cb not in known_codebases:
+                        warnings.append(
+                            f"Codebase '{cb}' not found in machine registry. "
+                            "Install it with 'cast codebase install <path> -n {cb}'."
+                        )
         except Exception as e:
             warnings.append(f"Peer check skipped due to error: {e}")
 
@@ -495,13 +739,34 @@ def doctor():
         if not issues and not warnings:
             console.print("[green][OK] Cast configuration looks good![/green]")
 
-        # Use proper process exit codes for CLI consumers
-        raise typer.Exit(0 if not issues else 1)
-
     except Exception as e:
         console.print(f"[red]Error during check: {e}[/red]")
         raise typer.Exit(2) from e
 
+    # Use proper process exit codes for CLI consumers (raised outside the try so
+    # the Exit itself is not reported as an error).
+    raise typer.Exit(0 if not issues else 1)
+
+
+def _report_json_chunks(vault_path: Path, index) -> Iterable[bytes]:
+    """Yield the report document piecewise, one file record per line."""
+    head = {
+        "cast_dir": str(vault_path),
+        "files": len(index.by_id),
+        "peers": list(index.all_peers()),
+        "codebases": list(index.all_codebases()),
+    }
+    records = (
+        {
+            "cast_id": cast_id,
+            "path": rec["relpath"],
+            "peers": rec["peers"],
+            "codebases": rec["codebases"],
+        }
+        for cast_id, rec in index.by_id.items()
+    )
+    return _json_object_chunks(head, "file_list", records)
+
 
 @app.command()
 def report():
@@ -511,10 +776,10 @@ def report():
 
         # Build index
         from cast_sync import build_ephemeral_index
+        from cast_sync.index import index_cache_path
 
         config_path = root / ".cast" / "config.yaml"
-        with open(config_path, encoding="utf-8") as f:
-            config = yaml.load(f)
+        config = _load_config(config_path)
 
         vault_path = root / "Cast"
 
@@ -522,29 +787,13 @@ def report():
             console.print(f"[red]Error: Cast folder not found at {vault_path}[/red]")
             raise typer.Exit(2)
 
-        index = build_ephemeral_index(root, vault_path, fixup=False)
-
-        # Generate report
-        report = {
-            "cast_dir": str(vault_path),
-            "files": len(index.by_id),
-            "peers": list(index.all_peers()),
-            "codebases": list(index.all_codebases()),
-            "file_list": [],
-        }
-
-        for cast_id, rec in index.by_id.items():
-            report["file_list"].append(
-                {
-                    "cast_id": cast_id,
-                    "path": rec["relpath"],
-                    "peers": rec["peers"],
-                    "codebases": rec["codebases"],
-                }
-            )
+        index = build_ephemeral_index(
+            root, vault_path, fixup=False, cache_path=index_cache_path(root)
+        )
 
-        # Output as JSON
-        print(json.dumps(report, indent=2))
+        # Output as JSON, streamed one file record at a time so large casts
+        # never hold a full file_list (or its rendered string) in memory.
+        _write_chunks(_report_json_chunks(vault_path, index))
 
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
@@ -585,14 +834,16 @@ def cb_list(json_out: bool = typer.Option(False, "--json", help="Output as JSON"
     try:
         cbs = list_codebases()
         if json_out:
-            print(json.dumps({"codebases": [
+            _print_json({"codebases": [
                 {"name": c.name, "root": str(c.root), "origin_cast": c.origin_cast} for c in cbs
-            ]}, indent=2))
+            ]})
             return
         console.rule("[bold cyan]Installed Codebases[/bold cyan]")
         if not cbs:
             console.print("[yellow]No codebases installed[/yellow]")
             return
+        from rich.table import Table
+
         t = Table(show_header=True, header_style="bold")
         t.add_column("Name")
         t.add_column("Root")
@@ -679,12 +930,11 @@ def cb_init(
                 console.print(f"[yellow]Warning:[/yellow] Cast '{to_cast}' is not installed yet. You can set it later with 'cast codebase install --to-cast'.")
             config["origin-cast"] = to_cast
         config_file = cast_config_dir / "config.yaml"
-        with open(config_file, "w", encoding="utf-8") as f:
-            yaml.dump(config, f)
+        _dump_config(config_file, config)
         
         # Create empty syncstate.json
         syncstate_file = cast_config_dir / "syncstate.json"
-        syncstate_file.write_text('{"baselines": {}, "last_sync": null}\n', encoding="utf-8")
+        _write_atomic(syncstate_file, _json_bytes({"baselines": {}, "last_sync": None}))
         
         # Vault for a codebase is docs/cast (no nested "Cast")
         vault_dir = cast_dir
@@ -722,6 +972,9 @@ def cbsync(
     debug: bool = typer.Option(False, "--debug", help="Show an execution plan"),
 ):
     """Sync between this Cast and a Codebase's docs/cast (no hsync)."""
+    from cast_sync import CodebaseSync
+    from rich.table import Table
+
     try:
         root = get_current_root()
 
@@ -730,11 +983,10 @@ def cbsync(
         config_path = root / ".cast" / "config.yaml"
         cfg = {}
         if config_path.exists():
-            with open(config_path, encoding="utf-8") as f:
-                try:
-                    cfg = yaml.load(f) or {}
-                except Exception:
-                    cfg = {}
+            try:
+                cfg = _load_config(config_path)
+            except Exception:
+                cfg = {}
 
         # Determine if we're in a codebase context and find the codebase
         original_root = root
@@ -776,12 +1028,11 @@ def cbsync(
             codebase_config_path = codebase_root / ".cast" / "config.yaml"
             codebase_cfg = {}
             if codebase_config_path.exists():
-                with open(codebase_config_path, encoding="utf-8") as f:
-                    try:
-                        codebase_cfg = yaml.load(f) or {}
-                    except Exception:
-                        codebase_cfg = {}
-            origin_cast = entry.origin_cast or (codebase_cfg.get("origin-cast") if isinstance(codebase_cfg, dict) else None)
+                try:
+                    codebase_cfg = _load_config(codebase_config_path)
+                except Exception:
+                    codebase_cfg = {}
+            origin_cast = entry.origin_cast or (codebase_cfg.get("origin-cast") if isinstance(codebase_cfg, Mapping) else None)
             if not origin_cast:
                 console.print(
                     "[red]No origin cast configured for this codebase.[/red]\n"
@@ -861,12 +1112,17 @@ try:
 except Exception:
     pass
 
-try:
-    from cast_cli.tui import tui_app
-    # `cast tui` runs the interactive shell directly (callback with invoke_without_command=True)
-    app.add_typer(tui_app, name="tui")
-except Exception:
-    pass
+
+@app.command("tui")
+def tui_cmd():
+    """Interactive terminal for Cast (via cast-tui framework)."""
+    # prompt_toolkit, cast_tui and the sync engine load only when the shell starts
+    try:
+        from cast_cli.tui import run
+    except ImportError as e:
+        console.print(f"[red]TUI unavailable:[/red] {e}")
+        raise typer.Exit(2) from e
+    run()
 
 if __name__ == "__main__":
     app()
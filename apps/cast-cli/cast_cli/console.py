@@ -0,0 +1,32 @@
+"""Shared console for the Cast CLI modules (rich is imported on first use)."""
+
+import re
+import sys
+
+# Style names the CLI uses in markup; any other bracketed text ([OK], "[note].md") is literal
+_STYLE = r"(?:bold|dim|italic|underline|red|green|yellow|blue|cyan|magenta|white)"
+# A markup tag such as [red], [/bold], [bold cyan] or [/], or a Rich escape "\[" (group 1)
+_MARKUP_RE = re.compile(rf"\\(\[)|\[(?:/?{_STYLE}(?: {_STYLE})*|/)\]")
+
+
+class _LazyConsole:
+    """Stand-in for rich's Console; the real one is created on first use."""
+
+    _console = None
+
+    def print(self, *objects, sep: str = " ", end: str = "\n", **kwargs) -> None:
+        """Print plain text without Rich's renderer when stdout is not a terminal."""
+        if kwargs or sys.stdout.isatty() or not all(isinstance(o, str) for o in objects):
+            return self.__getattr__("print")(*objects, sep=sep, end=end, **kwargs)
+        text = _MARKUP_RE.sub(lambda m: m.group(1) or "", sep.join(objects))
+        sys.stdout.write(text + end)
+
+    def __getattr__(self, name: str):
+        if self._console is None:
+            from rich.console import Console
+
+            type(self)._console = Console()
+        return getattr(self._console, name)
+
+
+console = _LazyConsole()
@@ -3,7 +3,7 @@
 Commands:
   cast gdoc new "<Title>" [--dir RELPATH] [--folder-id FOLDER] [--share-with EMAIL ...] [--auto-pull]
   cast gdoc add <doc_url> [--title TITLE] [--dir RELPATH] [--overwrite/--no-overwrite] [--auto-pull]
-  cast gdoc pull [<file.md> | --all]   # Pull one file or every GDoc note (prefixed with '(GDoc) ')
+  cast gdoc pull [<file.md> | --all] [--force]   # Pull one file or every GDoc note (prefixed with '(GDoc) ')
 
 Auth precedence:
   1) Service account via GOOGLE_APPLICATION_CREDENTIALS
@@ -11,40 +11,66 @@ Auth precedence:
 """
 from __future__ import annotations
 
+import functools
+import json
 import os
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, List, Optional, Tuple
-import dotenv
 
 import typer
-from rich.console import Console
-from rich.progress import Progress, BarColumn, TextColumn, TimeElapsedColumn
-from ruamel.yaml import YAML
+from cast_core.registry import cast_cache_dir
 
-from cast_core.yamlio import write_cast_file, parse_cast_file, ensure_cast_fields
+from cast_cli.console import console
 
-dotenv.load_dotenv()
+# This module is imported whenever the CLI starts; dotenv, rich.progress and
+# cast_core.yamlio (ruamel.yaml) are imported by the gdoc commands that need them.
 
 gdoc_app = typer.Typer(help="Google Docs integration (create, add & pull)")
-console = Console()
-yaml_rt = YAML()
-yaml_rt.preserve_quotes = True
-yaml_rt.default_flow_style = False
-yaml_rt.width = 4096
+
+
+@gdoc_app.callback()
+def _gdoc_setup():
+    """Google Docs integration (create, add & pull)."""
+    import dotenv
+
+    dotenv.load_dotenv()
+
+# Worker thread (with its own HTTP connection) for Docs calls overlapped with exports
+_worker: Optional[ThreadPoolExecutor] = None
+_thread_http = threading.local()
 
 DRIVE_SCOPES = ["https://www.googleapis.com/auth/drive"]
 DOCS_SCOPES = ["https://www.googleapis.com/auth/documents.readonly"]
 SCOPES = DRIVE_SCOPES + DOCS_SCOPES
 
+# Longest wait (seconds) for the background revisionId lookup; matches build_http()'s socket timeout
+REVISION_TIMEOUT = 60
+
+# Drive accepts at most 100 calls in one batch request
+DRIVE_BATCH_LIMIT = 100
+
+# How long a validated --folder-id stays in .cast/google/folder_cache.json (seconds)
+FOLDER_CACHE_TTL = 24 * 60 * 60
+
 # Extract a Google Doc ID from its URL
 DOC_URL_ID_RE = re.compile(r"/document/d/([a-zA-Z0-9_-]+)")
 
 
 # -------------------- small utils --------------------
+@functools.lru_cache(maxsize=1)
+def _local_tz():
+    """Local UTC offset, resolved once per process (CLI runs are short-lived)."""
+    return datetime.now(timezone.utc).astimezone().tzinfo
+
+
 def _now_iso() -> str:
-    return datetime.now(timezone.utc).astimezone().isoformat(timespec="minutes")
+    return datetime.now(_local_tz()).isoformat(timespec="minutes")
 
 
 def _sanitize_filename(name: str) -> str:
@@ -58,24 +84,14 @@ def _sanitize_filename(name: str) -> str:
 
 def _get_root_and_vault() -> tuple[Path, Path]:
     """Locate Cast root (contains .cast/) and standardized Cast folder."""
-    cur = Path.cwd()
-    root = None
-    if (cur / ".cast").exists():
-        root = cur
-    else:
-        for p in cur.parents:
-            if (p / ".cast").exists():
-                root = p
-                break
-    if root is None:
-        console.print("[red]Not in a Cast root (no .cast/ found)[/red]")
-        raise typer.Exit(2)
+    # Same discovery as the core commands: CAST_ROOT, then a memoized walk up from cwd
+    from cast_cli.cli import get_current_root
+
+    root = get_current_root()
     cfg_path = root / ".cast" / "config.yaml"
     if not cfg_path.exists():
         console.print("[red].cast/config.yaml missing[/red]")
         raise typer.Exit(2)
-    with open(cfg_path, encoding="utf-8") as f:
-        cfg = yaml_rt.load(f) or {}
     vault = root / "Cast"
     if not vault.exists():
         console.print(f"[red]Cast folder not found at {vault}[/red]")
@@ -83,12 +99,17 @@ def _get_root_and_vault() -> tuple[Path, Path]:
     return root, vault
 
 
+def _vault_dir(vault: Path, rel: Path) -> Path:
+    """Absolute, normalised `vault/rel` (lexical only; no per-component symlink lookups)."""
+    return Path(os.path.abspath(os.path.join(vault, rel)))
+
+
 def _ensure_google_deps():
     """Fail fast with a guidance message if google deps are not installed."""
     try:
-        import googleapiclient  # noqa: F401
-        import google_auth_oauthlib  # noqa: F401
         import google.oauth2  # noqa: F401
+        import google_auth_oauthlib  # noqa: F401
+        import googleapiclient  # noqa: F401
     except Exception:
         console.print(
             "[red]Missing Google client libraries.[/red]\n"
@@ -101,10 +122,10 @@ def _ensure_google_deps():
 def _get_creds(root: Path):
     """Return Google credentials (service account preferred; else OAuth)."""
     _ensure_google_deps()
-    from google.oauth2.service_account import Credentials as SA
+    from google.auth.transport.requests import Request
     from google.oauth2.credentials import Credentials as UserCreds
+    from google.oauth2.service_account import Credentials as SA
     from google_auth_oauthlib.flow import InstalledAppFlow
-    from google.auth.transport.requests import Request
 
     # 1) Service account
     sa_path = os.getenv("GOOGLE_APPLICATION_CREDENTIALS")
@@ -151,8 +172,37 @@ def _build_services(root: Path):
     return drive, docs
 
 
-def _resolve_folder_id(drive, folder_id: str) -> str:
-    """Resolve shortcuts and validate Shared Drive folders."""
+def _load_json_cache(cache_path: Path) -> dict:
+    """Return a JSON object cache file's contents; empty if missing or unreadable."""
+    try:
+        data = json.loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _save_json_cache(cache_path: Path, cache: dict) -> None:
+    """Persist a JSON cache atomically (best effort)."""
+    tmp = cache_path.with_name(f".{cache_path.name}.casttmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        tmp.replace(cache_path)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def _resolve_folder_id(drive, folder_id: str, cache_path: Optional[Path] = None) -> str:
+    """
+    Resolve shortcuts and validate Shared Drive folders.
+    With `cache_path`, validated results are reused for FOLDER_CACHE_TTL seconds.
+    """
+    # {folder_id: {"id": resolved_id, "ts": epoch_seconds}}
+    cache = _load_json_cache(cache_path) if cache_path else {}
+    hit = cache.get(folder_id)
+    if isinstance(hit, dict) and time.time() - hit.get("ts", 0) < FOLDER_CACHE_TTL:
+        return hit["id"]
+
     try:
         meta = drive.files().get(
             fileId=folder_id,
@@ -186,7 +236,10 @@ def _resolve_folder_id(drive, folder_id: str) -> str:
             "Use a Shared Drive folder to avoid service-account quota issues."
         )
         raise typer.Exit(2)
-    
+
+    if cache_path:
+        cache[folder_id] = {"id": meta["id"], "ts": time.time()}
+        _save_json_cache(cache_path, cache)
     return meta["id"]
 
 
@@ -221,11 +274,79 @@ def _create_google_doc(drive, title: str, parent_folder_id: Optional[str]) -> tu
     return doc_id, url
 
 
+def _share_doc(drive, doc_id: str, emails: Iterable[str]) -> None:
+    """Grant writer access to each email, sending the grants as Drive batch requests."""
+    failures: list[str] = []
+
+    def _on_result(request_id, response, exception):
+        if exception is not None:
+            failures.append(f"{request_id}: {exception}")
+
+    # Batch request ids must be unique, so drop repeated emails (order kept)
+    unique = list(dict.fromkeys(emails))
+    for start in range(0, len(unique), DRIVE_BATCH_LIMIT):
+        batch = drive.new_batch_http_request(callback=_on_result)
+        for email in unique[start:start + DRIVE_BATCH_LIMIT]:
+            batch.add(
+                drive.permissions().create(
+                    fileId=doc_id,
+                    body={"type": "user", "role": "writer", "emailAddress": email},
+                    sendNotificationEmail=False,
+                    supportsAllDrives=True,
+                ),
+                request_id=email,
+            )
+        try:
+            batch.execute()
+        except Exception as e:
+            failures.append(str(e))
+
+    if failures:
+        console.print(
+            "[yellow]Warning:[/yellow] failed to add some permissions: " + "; ".join(failures)
+        )
+
+
 def _export_markdown(drive, doc_id: str) -> str:
     data = drive.files().export(fileId=doc_id, mimeType="text/markdown").execute()
     return data.decode("utf-8")
 
 
+def _background() -> ThreadPoolExecutor:
+    """Single worker thread for API calls that overlap with the main thread's request."""
+    global _worker
+    if _worker is None:
+        _worker = ThreadPoolExecutor(max_workers=1, thread_name_prefix="gdoc")
+    return _worker
+
+
+def _fetch_revision_id(request) -> Optional[str]:
+    """
+    Execute a documents().get request on the worker thread and return its revisionId.
+    httplib2 connections are not thread-safe, so the worker keeps its own authorized one
+    (built like the service's own transport, including its socket timeout).
+    """
+    http = getattr(_thread_http, "http", None)
+    if http is None:
+        import google_auth_httplib2
+        from googleapiclient.http import build_http
+
+        http = google_auth_httplib2.AuthorizedHttp(request.http.credentials, http=build_http())
+        _thread_http.http = http
+    try:
+        return request.execute(http=http).get("revisionId")
+    except Exception:
+        return None
+
+
+def _revision_result(future) -> Optional[str]:
+    """revisionId from a _fetch_revision_id future, or None if it is not back in time."""
+    try:
+        return future.result(timeout=REVISION_TIMEOUT)
+    except FutureTimeout:
+        return None
+
+
 def _doc_id_from_url_field(fm: dict) -> Optional[str]:
     """Extract Google Doc ID solely from the 'url' field in front matter."""
     url = (fm or {}).get("url")
@@ -246,11 +367,17 @@ def _iter_gdoc_notes(vault: Path) -> Iterable[Path]:
             continue
 
 
-def _pull_one_note(drive, docs, file: Path) -> Tuple[bool, Optional[str]]:
+def _pull_one_note(
+    drive, docs, file: Path, revisions: Optional[dict] = None
+) -> Tuple[bool, Optional[str]]:
     """
     Pull Markdown from the linked Google Doc and refresh the local note body.
-    Returns (ok, revision_id).
+    With `revisions` (note path -> {"rev", "mtime_ns"} from the last pull), the export is
+    skipped when neither the Doc revision nor the note file has changed since; the
+    mapping is updated after a pull. Returns (ok, revision_id).
     """
+    from cast_core.yamlio import parse_cast_file, write_cast_file
+
     fm, _, _ = parse_cast_file(file)
     if fm is None:
         console.print(f"[red]File lacks YAML front matter:[/red] {file}")
@@ -271,6 +398,21 @@ def _pull_one_note(drive, docs, file: Path) -> Tuple[bool, Optional[str]]:
         console.print(f"[red]Missing or invalid 'url' in front matter (cannot derive Google Doc ID):[/red] {file}")
         return False, None
 
+    # Get revisionId (best-effort) while the export downloads
+    rev_future = _background().submit(
+        _fetch_revision_id, docs.documents().get(documentId=doc_id, fields="revisionId")
+    )
+    # Nothing to do if the Doc has no new revision and the note was not touched since
+    key = os.path.abspath(file)
+    seen = revisions.get(key) if revisions is not None else None
+    if (
+        isinstance(seen, dict)
+        and _revision_result(rev_future) == seen.get("rev")
+        and file.stat().st_mtime_ns == seen.get("mtime_ns")
+    ):
+        console.print(f"[dim]Up to date:[/dim] {file}")
+        return True, seen["rev"]
+
     # Export Markdown
     try:
         md = _export_markdown(drive, doc_id)
@@ -278,12 +420,7 @@ def _pull_one_note(drive, docs, file: Path) -> Tuple[bool, Optional[str]]:
         console.print(f"[red]Export failed for {file} (doc {doc_id}):[/red] {e}")
         return False, None
 
-    # Get revisionId for provenance (best-effort)
-    try:
-        doc = docs.documents().get(documentId=doc_id).execute()
-        rev = doc.get("revisionId")
-    except Exception:
-        rev = None
+    rev = _revision_result(rev_future)
 
     # Update FM
     fm["last-updated"] = _now_iso()
@@ -293,6 +430,11 @@ def _pull_one_note(drive, docs, file: Path) -> Tuple[bool, Optional[str]]:
     fm.pop("document_id", None)
 
     write_cast_file(file, fm, md, reorder=True)
+    if revisions is not None:
+        if rev:
+            revisions[key] = {"rev": rev, "mtime_ns": file.stat().st_mtime_ns}
+        else:
+            revisions.pop(key, None)
     return True, rev
 
 
@@ -343,6 +485,8 @@ def gdoc_add(
     with YAML front-matter (url, last-updated, cast-*) only. The Doc ID is derived from the URL at runtime.
     Optionally auto-pulls the content immediately.
     """
+    from cast_core.yamlio import ensure_cast_fields, write_cast_file
+
     root, vault = _get_root_and_vault()
 
     m = DOC_URL_ID_RE.search(doc_url)
@@ -358,7 +502,7 @@ def gdoc_add(
         title = _fetch_doc_title(docs, doc_id) or doc_id
     safe_title = _sanitize_filename(title)
 
-    note_dir = (vault / dir).resolve()
+    note_dir = _vault_dir(vault, dir)
     note_dir.mkdir(parents=True, exist_ok=True)
     note_path = note_dir / f"(GDoc) {safe_title}.md"
     if note_path.exists() and not overwrite:
@@ -411,6 +555,8 @@ def gdoc_new(
     Create an empty Google Doc with the same title as the note and link it with a 'url' in YAML.
     Optionally auto-pulls the content immediately (useful if the Doc has initial content).
     """
+    from cast_core.yamlio import ensure_cast_fields, write_cast_file
+
     root, vault = _get_root_and_vault()
     
     # Fail fast if using a service account without a Shared Drive folder
@@ -426,11 +572,13 @@ def gdoc_new(
 
     # Resolve and validate folder ID if provided
     if folder_id:
-        folder_id = _resolve_folder_id(drive, folder_id)
+        folder_id = _resolve_folder_id(
+            drive, folder_id, cache_path=root / ".cast" / "google" / "folder_cache.json"
+        )
 
     # File path
     safe_title = _sanitize_filename(title)
-    note_path = (vault / dir).resolve() / f"(GDoc) {safe_title}.md"
+    note_path = _vault_dir(vault, dir) / f"(GDoc) {safe_title}.md"
     note_path.parent.mkdir(parents=True, exist_ok=True)
 
     # Create Doc
@@ -438,16 +586,7 @@ def gdoc_new(
 
     # Optional sharing
     if share_with:
-        try:
-            for email in share_with:
-                drive.permissions().create(
-                    fileId=doc_id,
-                    body={"type": "user", "role": "writer", "emailAddress": email},
-                    sendNotificationEmail=False,
-                    supportsAllDrives=True,
-                ).execute()
-        except Exception as e:
-            console.print(f"[yellow]Warning:[/yellow] failed to add some permissions: {e}")
+        _share_doc(drive, doc_id, share_with)
 
     # Initialize front-matter
     front = {
@@ -488,6 +627,9 @@ def gdoc_pull(
         False, "--all", "-a", "--a",
         help="Pull all GDoc notes in the cast (files prefixed with '(GDoc) ')."
     ),
+    force: bool = typer.Option(
+        False, "--force", help="Export even if the Doc and the note are unchanged since the last pull."
+    ),
 ):
     """
     Pull Markdown from the linked Google Doc(s) and refresh the local note body/bodies.
@@ -495,9 +637,15 @@ def gdoc_pull(
     """
     root, vault = _get_root_and_vault()
     drive, docs = _build_services(root)
+    # Revision seen per note at its last pull; lets unchanged Docs skip the export.
+    # Keyed by absolute path and mtime, so it is per machine and lives outside the cast.
+    revisions_path = cast_cache_dir(root) / "gdoc-revisions.json"
+    revisions = _load_json_cache(revisions_path)
 
     # Pull everything
     if all_:
+        from rich.progress import BarColumn, Progress, TextColumn, TimeElapsedColumn
+
         files = list(_iter_gdoc_notes(vault))
         if not files:
             console.print("[yellow]No '(GDoc) ' notes found in the cast.[/yellow]")
@@ -514,11 +662,14 @@ def gdoc_pull(
         ) as progress:
             t = progress.add_task("Pulling", total=len(files))
             for p in files:
-                success, _rev = _pull_one_note(drive, docs, p)
+                if force:
+                    revisions.pop(os.path.abspath(p), None)
+                success, _rev = _pull_one_note(drive, docs, p, revisions)
                 ok += 1 if success else 0
                 failed += 0 if success else 1
                 progress.advance(t, 1)
 
+        _save_json_cache(revisions_path, revisions)
         console.print(f"[green]✔ Completed[/green] — {ok} succeeded, {failed} failed.")
         raise typer.Exit(0 if failed == 0 else 1)
 
@@ -530,7 +681,10 @@ def gdoc_pull(
         console.print(f"[red]Not found:[/red] {file}")
         raise typer.Exit(2)
 
-    success, rev = _pull_one_note(drive, docs, file)
+    if force:
+        revisions.pop(os.path.abspath(file), None)
+    success, rev = _pull_one_note(drive, docs, file, revisions)
+    _save_json_cache(revisions_path, revisions)
     if not success:
         raise typer.Exit(2)
     console.print(f"[green]✔ Updated[/green] {file}")
\ No newline at end of file
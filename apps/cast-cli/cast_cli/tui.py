@@ -17,9 +17,14 @@ tui_app = typer.Typer(help="Interactive terminal for Cast (via cast-tui framewor
 console = Console()
 
 
-@tui_app.callback(invoke_without_command=True)
-def tui(_ctx: typer.Context) -> None:
+def run() -> None:
+    """Start the interactive Cast shell."""
     app = TerminalApp()
     # Register the Cast plugin (file search, preview, edit, sync, report, peers)
     app.register_plugin(CastTUIPlugin())
-    app.run()
\ No newline at end of file
+    app.run()
+
+
+@tui_app.callback(invoke_without_command=True)
+def tui(_ctx: typer.Context) -> None:
+    run()
@@ -3,9 +3,14 @@
 from __future__ import annotations
 
 import os
+import re
 import shlex
+import subprocess
 import sys
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import cache
+from operator import attrgetter
 from pathlib import Path
 from typing import Optional
 
@@ -14,7 +19,6 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from ruamel.yaml import YAML
 
 from prompt_toolkit.completion import Completer, Completion, FuzzyCompleter, NestedCompleter
 from prompt_toolkit.formatted_text import HTML
@@ -22,17 +26,13 @@ from prompt_toolkit.key_binding import KeyBindings
 
 from cast_tui import TerminalContext, Command, Plugin
 from cast_sync import build_ephemeral_index, HorizontalSync
+from cast_sync.index import EphemeralIndex, index_cache_path
 from cast_sync import CodebaseSync
 from cast_core.registry import list_codebases
+from cast_core.yamlfast import load_yaml
 from cast_core.yamlio import parse_cast_file
 
 
-_yaml = YAML()
-_yaml.preserve_quotes = True
-_yaml.default_flow_style = False
-_yaml.width = 4096
-
-
 # -------------------- Cast state & helpers --------------------
 
 def _find_cast_root() -> Path:
@@ -45,77 +45,161 @@ def _find_cast_root() -> Path:
     raise RuntimeError("Not in a Cast root (no .cast/ found)")
 
 
-def _read_config(root: Path) -> tuple[str, Path]:
+def _read_config(root: Path) -> tuple[str, Path, frozenset[str]]:
     cfg = root / ".cast" / "config.yaml"
     if not cfg.exists():
         raise RuntimeError(".cast/config.yaml missing")
-    with open(cfg, encoding="utf-8") as f:
-        data = _yaml.load(f) or {}
-    cast_name = data.get("cast-name", "")
+    # Read-only load; nothing here writes config.yaml back, so no round-trip parser
+    data = load_yaml(cfg.read_bytes()) or {}
+    cast_name = str(data.get("cast-name", ""))
     vault = root / "Cast"
     if not vault.exists():
         raise RuntimeError(f"Cast folder not found at {vault}")
-    return cast_name, vault
+    ignored = _IGNORED_DIRS | frozenset(str(d) for d in (data.get("tui-ignore") or ()))
+    return cast_name, vault, ignored
+
+
+# Characters that force a completion to be inserted double-quoted
+_NEEDS_QUOTING_RE = re.compile(r"[\s\"'\\&|;<>*?()\[\]{}]")
+
+# Plain files whose first "# " heading is shown as their title
+_TITLED_SUFFIXES = (".md", ".txt")
 
+# Folder names never descended into when listing the vault; extend via `tui-ignore` in config.yaml
+_IGNORED_DIRS = frozenset({".git", ".obsidian", ".cast", ".venv", "node_modules", "__pycache__"})
 
-@dataclass
+
+def _walk_vault(vault: Path, ignored: frozenset[str] = _IGNORED_DIRS):
+    """
+    Yield (relpath, titled) for every regular file below `vault`, where
+    `titled` says whether the name ends in one of _TITLED_SUFFIXES.
+    Dot-prefixed files and folders are skipped, as are folders named in
+    `ignored` (pruned before descending). Symlinked files are listed (as rglob
+    did); symlinked folders are not descended into.
+    """
+    base = os.fspath(vault)
+    cut = len(os.path.join(base, ""))
+    stack = [base]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if entry.name.startswith("."):
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in ignored:
+                            stack.append(entry.path)
+                    elif entry.is_file():
+                        yield entry.path[cut:], entry.name.lower().endswith(_TITLED_SUFFIXES)
+        except OSError:
+            continue
+
+
+def _read_first_md_header(path: str) -> str | None:
+    """Return the text of a leading '# ' heading line, or None."""
+    try:
+        with open(path, "rb", buffering=0) as f:
+            head = f.read(256)
+    except OSError:
+        return None
+    nl = head.find(b"\n")
+    first_line = (head if nl == -1 else head[:nl]).strip()
+    if first_line.startswith(b"# "):
+        return first_line[2:].decode("utf-8", errors="replace").strip()
+    return None
+
+
+@dataclass(slots=True, frozen=True)
 class FileItem:
     cast_id: str | None
     relpath: str
     title: str | None
+    relpath_lower: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so _by_path lookups hit the identity fast path; lowered once for sorting
+        object.__setattr__(self, "relpath", sys.intern(self.relpath))
+        object.__setattr__(self, "relpath_lower", self.relpath.lower())
 
 
 class CastContext:
     """In-memory view of the Cast folder and ephemeral index."""
-    def __init__(self, root: Path, vault: Path, cast_name: str):
+    def __init__(self, root: Path, vault: Path, cast_name: str, ignored: frozenset[str] = _IGNORED_DIRS):
         self.root = root
         self.vault = vault
         self.cast_name = cast_name
+        self.ignored = ignored
         self.items: list[FileItem] = []
+        # Ephemeral index from the last reindex(); report/peers/codebases read it
+        self.idx: Optional[EphemeralIndex] = None
         self._by_id: dict[str, FileItem] = {}
         self._by_path: dict[str, FileItem] = {}
+        # relpath -> (mtime_ns, size, title) of Cast files as of the last reindex
+        self._title_cache: dict[str, tuple[int, int, str | None]] = {}
 
-    def reindex(self) -> None:
-        idx = build_ephemeral_index(self.root, self.vault, fixup=False)
-        items: list[FileItem] = []
-        cast_paths = set()
-
-        for rec in idx.by_id.values():
-            p = self.vault / rec["relpath"]
-            cast_paths.add(rec["relpath"])
+    def _cast_title(self, relpath: str, cache: dict) -> str | None:
+        """Front-matter title of a Cast file; re-parsed only if its stat changed."""
+        path = os.path.join(self.vault, relpath)
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        sig = (st.st_mtime_ns, st.st_size)
+        hit = self._title_cache.get(relpath)
+        if hit is not None and hit[:2] == sig:
+            title = hit[2]
+        else:
             title = None
             try:
-                fm, _body, has = parse_cast_file(p)
+                fm, _body, has = parse_cast_file(Path(path))
                 if has and isinstance(fm, dict):
                     title = fm.get("title") or fm.get("name")
             except Exception:
                 pass
-            items.append(FileItem(cast_id=rec["cast_id"], relpath=rec["relpath"], title=title))
+        cache[relpath] = (*sig, title)
+        return title
+
+    def reindex(self) -> None:
+        idx = build_ephemeral_index(
+            self.root, self.vault, fixup=False, cache_path=index_cache_path(self.root)
+        )
+        items: list[FileItem] = []
+        by_id: dict[str, FileItem] = {}
+        cast_paths = set()
+        title_cache: dict[str, tuple[int, int, str | None]] = {}
+
+        for rec in idx.by_id.values():
+            cast_paths.add(rec["relpath"])
+            title = self._cast_title(rec["relpath"], title_cache)
+            it = FileItem(cast_id=rec["cast_id"], relpath=rec["relpath"], title=title)
+            items.append(it)
+            if it.cast_id:
+                by_id[it.cast_id] = it
+        # Rebuilt each time so deleted files drop out
+        self._title_cache = title_cache
 
         # include non-cast files for convenience
         try:
-            for file_path in self.vault.rglob("*"):
-                if file_path.is_file():
-                    relpath = str(file_path.relative_to(self.vault))
-                    if relpath in cast_paths:
-                        continue
-                    title = None
-                    if file_path.suffix.lower() in {".md", ".txt"}:
-                        try:
-                            with open(file_path, "r", encoding="utf-8") as f:
-                                first_line = f.readline().strip()
-                                if first_line.startswith("# "):
-                                    title = first_line[2:].strip()
-                        except Exception:
-                            pass
-                    items.append(FileItem(cast_id=None, relpath=relpath, title=title))
+            extra = [
+                (relpath, titled)
+                for relpath, titled in _walk_vault(self.vault, self.ignored)
+                if relpath not in cast_paths
+            ]
+            # Title reads are one small open+read each; overlap them across threads
+            titled = [os.path.join(self.vault, rel) for rel, titled in extra if titled]
+            with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as pool:
+                titles = dict(zip(titled, pool.map(_read_first_md_header, titled), strict=True))
+            for relpath, _titled in extra:
+                title = titles.get(os.path.join(self.vault, relpath))
+                items.append(FileItem(cast_id=None, relpath=relpath, title=title))
         except Exception:
             pass
 
-        items.sort(key=lambda it: it.relpath.lower())
+        items.sort(key=attrgetter("relpath_lower"))
+        self.idx = idx
         self.items = items
-        self._by_id = {it.cast_id: it for it in items if it.cast_id}
-        self._by_path = {it.relpath: it for it in items}
+        self._by_id = by_id
+        self._by_path = dict(zip(map(attrgetter("relpath"), items), items, strict=True))
 
     def resolve(self, token: str) -> Optional[FileItem]:
         if not token:
@@ -130,14 +214,15 @@ class CastContext:
 
 
 class CastFileCompleter(Completer):
-    """Dynamic file completer over CastContext; FuzzyCompleter wraps this via the framework."""
+    """Dynamic file completer over CastContext; FuzzyCompleter wraps this via the framework.
+
+    Candidates are pre-filtered with a cheap in-order character check so the
+    framework's pure-Python fuzzy scorer only ranks plausible matches.
+    """
 
     @staticmethod
     def _needs_quoting(s: str) -> bool:
-        if not s:
-            return True
-        specials = set(' \t\r\n"\'\\&|;<>*?()[]{}')
-        return any((c in specials) or c.isspace() for c in s)
+        return not s or _NEEDS_QUOTING_RE.search(s) is not None
 
     @staticmethod
     def _dq(s: str) -> str:
@@ -154,23 +239,58 @@ class CastFileCompleter(Completer):
 
     def __init__(self, ctx: CastContext):
         self.ctx = ctx
+        # Insert/display strings, rebuilt only when reindex() replaces ctx.items
+        self._rows_for: list[FileItem] | None = None
+        self._inserts: list[str] = []
+        self._displays: list[str] = []
+        self._keys: list[str] = []
+
+    @staticmethod
+    def _is_subsequence(needle: str, haystack: str) -> bool:
+        rest = iter(haystack)
+        return all(c in rest for c in needle)
+
+    def _rows(self) -> tuple[list[str], list[str], list[str]]:
+        items = self.ctx.items
+        if self._rows_for is not items:
+            inserts, displays, keys = [], [], []
+            for it in items:
+                subtitle = f" — {it.title}" if it.title else ""
+                if it.cast_id:
+                    displays.append(f"{it.relpath}{subtitle} · {it.cast_id[:8]}…")
+                else:
+                    displays.append(f"{it.relpath}{subtitle}")
+                insert = it.relpath
+                inserts.append(self._dq(insert) if self._needs_quoting(insert) else insert)
+                keys.append(insert.lower())
+            self._inserts, self._displays, self._keys = inserts, displays, keys
+            self._rows_for = items
+        return self._inserts, self._displays, self._keys
 
     def get_completions(self, document, _event):
         token, token_len = self._current_arg_token_and_len(document)
-        for it in self.ctx.items:
-            subtitle = f" — {it.title}" if it.title else ""
-            if it.cast_id:
-                disp = f"{it.relpath}{subtitle} · {it.cast_id[:8]}…"
-            else:
-                disp = f"{it.relpath}{subtitle}"
-            insert = it.relpath
-            if self._needs_quoting(insert):
-                insert = self._dq(insert)
+        needle = token.lstrip("\"'").lower()
+        inserts, displays, keys = self._rows()
+        for insert, disp, key in zip(inserts, displays, keys, strict=True):
+            if needle and not self._is_subsequence(needle, key):
+                continue
             yield Completion(insert, start_position=-token_len, display=disp)
 
 
 # -------------------- commands & helpers --------------------
 
+@cache
+def _preview_yaml():
+    """Shared ruamel emitter for front-matter previews (built on first use)."""
+    from ruamel.yaml import YAML
+
+    y = YAML()
+    y.preserve_quotes = True
+    y.default_flow_style = False
+    y.width = 120
+    return y
+
+
 def _preview_file(console: Console, vault: Path, it: FileItem) -> None:
     path = vault / it.relpath
     if not path.exists():
@@ -192,11 +312,7 @@ def _preview_file(console: Console, vault: Path, it: FileItem) -> None:
             try:
                 from io import StringIO
                 buf = StringIO()
-                y = YAML()
-                y.preserve_quotes = True
-                y.default_flow_style = False
-                y.width = 120
-                y.dump(sub, buf)
+                _preview_yaml().dump(sub, buf)
                 console.print(Panel.fit(buf.getvalue().rstrip("\n"), title="YAML (subset)", border_style="cyan"))
             except Exception:
                 pass
@@ -207,7 +323,7 @@ def _preview_file(console: Console, vault: Path, it: FileItem) -> None:
             with open(path, "r", encoding="utf-8", errors="replace") as f:
                 content = f.read()
             snippet = "\n".join(content.splitlines()[:60]) or "_(empty)_"
-            if path.suffix.lower() == ".md":
+            if path.name.lower().endswith(".md"):
                 console.print(Panel(Markdown(snippet), title="Content (first 60 lines)", expand=True))
             else:
                 console.print(Panel(snippet, title="Content (first 60 lines)", expand=True))
@@ -266,8 +382,8 @@ class CastTUIPlugin(Plugin):
 
     def register(self, ctx: TerminalContext) -> None:
         root = _find_cast_root()
-        cast_name, vault = _read_config(root)
-        self._cast = CastContext(root, vault, cast_name)
+        cast_name, vault, ignored = _read_config(root)
+        self._cast = CastContext(root, vault, cast_name, ignored)
         self._cast.reindex()
         self._file_completer = CastFileCompleter(self._cast)
 
@@ -351,15 +467,25 @@ class CastTUIPlugin(Plugin):
             ctx.console.print(f"[red]No match[/red] for '{args[0]}'")
             return
         path = self._cast.vault / it.relpath
+        # $EDITOR may carry flags (e.g. "code -w"); split it without a shell
         if sys.platform.startswith("win"):
             editor = os.environ.get("EDITOR") or "notepad"
+            # Non-POSIX mode keeps backslashes; drop the quotes it leaves around tokens
+            argv = [
+                t[1:-1] if len(t) > 1 and t[0] == t[-1] == '"' else t
+                for t in shlex.split(editor, posix=False)
+            ]
         else:
             editor = os.environ.get("EDITOR") or "vi"
+            argv = shlex.split(editor)
         try:
             ctx.console.print(f"[dim]Opening editor:[/dim] {editor} {path}")
-            os.system(f'{editor} "{path}"')
+            subprocess.run([*argv, str(path)], check=False)
         except Exception as e:
             ctx.console.print(f"[red]Failed to open editor:[/red] {e}")
+            return
+        # The edit may have changed front matter; refresh the index report/peers/codebases read
+        self._cast.reindex()
 
     def _cmd_sync(self, ctx: TerminalContext, args: list[str]) -> None:
         tok = args[0] if args else None
@@ -374,7 +500,7 @@ class CastTUIPlugin(Plugin):
             ctx.console.print("[red][ERROR][/red] Sync failed")
 
     def _cmd_report(self, ctx: TerminalContext, _args: list[str]) -> None:
-        idx = build_ephemeral_index(self._cast.root, self._cast.vault, fixup=False)
+        idx = self._cast.idx
         table = Table(show_header=True, header_style="bold")
         table.add_column("Metric")
         table.add_column("Value", justify="right")
@@ -384,7 +510,7 @@ class CastTUIPlugin(Plugin):
         ctx.console.print(table)
 
     def _cmd_peers(self, ctx: TerminalContext, _args: list[str]) -> None:
-        idx = build_ephemeral_index(self._cast.root, self._cast.vault, fixup=False)
+        idx = self._cast.idx
         peers = sorted(idx.all_peers())
         if not peers:
             ctx.console.print("[dim]No peers referenced in files.[/dim]")
@@ -396,7 +522,7 @@ class CastTUIPlugin(Plugin):
         ctx.console.print(t)
 
     def _cmd_codebases(self, ctx: TerminalContext, _args: list[str]) -> None:
-        idx = build_ephemeral_index(self._cast.root, self._cast.vault, fixup=False)
+        idx = self._cast.idx
         referenced = sorted(idx.all_codebases())
         installed = {c.name: c for c in list_codebases()}
         t = Table(show_header=True, header_style="bold")
@@ -421,6 +547,8 @@ class CastTUIPlugin(Plugin):
         file_arg = args[1] if len(args) > 1 else None
         syncer = CodebaseSync(self._cast.root)
         code = syncer.sync(cb, file_filter=file_arg, non_interactive=True)
+        # cbsync may create or update Cast files; keep the cached index current
+        self._cast.reindex()
         if code == 0:
             ctx.console.print("[green][OK][/green] Codebase sync completed")
         elif code == 3:
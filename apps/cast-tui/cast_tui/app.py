@@ -42,6 +42,13 @@ class Plugin(Protocol):
     def default_command(self, ctx: TerminalContext) -> str: ...
 
 
+def _split_command(text: str) -> list[str]:
+    """Split a command line like shlex.split; plain lines skip the lexer."""
+    if '"' in text or "'" in text or "\\" in text:
+        return shlex.split(text)
+    return text.split()
+
+
 # ------------------------- terminal app -------------------------
 
 class TerminalApp:
@@ -216,7 +223,7 @@ class TerminalApp:
             if not text:
                 continue
 
-            parts = shlex.split(text)
+            parts = _split_command(text)
             cmd_name = parts[0]
             args = parts[1:]
 
@@ -1,42 +1,95 @@
 """Cast Core - parsing, normalization, and digest utilities."""
 
-from cast_core.digest import compute_digest, normalize_yaml_for_digest
-from cast_core.models import (
-    CastConfig,
-    FileRec,
-    SyncState,
-    SyncStateEntry,
-)
-from cast_core.registry import (
-    cast_home_dir,
-    list_casts,
-    load_registry,
-    register_cast,
-    registry_path,
-    resolve_cast_by_id,
-    resolve_cast_by_name,
-    save_registry,
-    unregister_cast,
-    # codebases
-    list_codebases,
-    register_codebase,
-    resolve_codebase_by_name,
-    unregister_codebase,
-)
-from cast_core.yamlio import (
-    ensure_cast_fields,
-    ensure_codebase_membership,
-    extract_cast_fields,
-    parse_cast_file,
-    reorder_cast_fields,
-    write_cast_file,
-)
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from cast_core.digest import compute_digest, normalize_yaml_for_digest
+    from cast_core.models import (
+        CastConfig,
+        FileRec,
+        SyncState,
+        SyncStateEntry,
+    )
+    from cast_core.registry import (
+        cast_cache_dir,
+        cast_home_dir,
+        list_casts,
+        load_registry,
+        register_cast,
+        registry_path,
+        resolve_cast_by_id,
+        resolve_cast_by_name,
+        save_registry,
+        unregister_cast,
+        # codebases
+        list_codebases,
+        register_codebase,
+        resolve_codebase_by_name,
+        unregister_codebase,
+    )
+    from cast_core.yamlio import (
+        ensure_cast_fields,
+        ensure_codebase_membership,
+        extract_cast_fields,
+        parse_cast_file,
+        reorder_cast_fields,
+        write_cast_file,
+    )
+
+# Public name -> submodule. Submodules (and their pydantic models) are only
+# imported when one of their names is first accessed (PEP 562).
+_LAZY = {
+    "compute_digest": "cast_core.digest",
+    "normalize_yaml_for_digest": "cast_core.digest",
+    "CastConfig": "cast_core.models",
+    "FileRec": "cast_core.models",
+    "SyncState": "cast_core.models",
+    "SyncStateEntry": "cast_core.models",
+    "cast_cache_dir": "cast_core.registry",
+    "cast_home_dir": "cast_core.registry",
+    "list_casts": "cast_core.registry",
+    "load_registry": "cast_core.registry",
+    "register_cast": "cast_core.registry",
+    "registry_path": "cast_core.registry",
+    "resolve_cast_by_id": "cast_core.registry",
+    "resolve_cast_by_name": "cast_core.registry",
+    "save_registry": "cast_core.registry",
+    "unregister_cast": "cast_core.registry",
+    "list_codebases": "cast_core.registry",
+    "register_codebase": "cast_core.registry",
+    "resolve_codebase_by_name": "cast_core.registry",
+    "unregister_codebase": "cast_core.registry",
+    "ensure_cast_fields": "cast_core.yamlio",
+    "ensure_codebase_membership": "cast_core.yamlio",
+    "extract_cast_fields": "cast_core.yamlio",
+    "parse_cast_file": "cast_core.yamlio",
+    "reorder_cast_fields": "cast_core.yamlio",
+    "write_cast_file": "cast_core.yamlio",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # later lookups bypass __getattr__
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
 
 __all__ = [
     "compute_digest",
     "normalize_yaml_for_digest",
     # registry
     "cast_home_dir",
+    "cast_cache_dir",
     "registry_path",
     "load_registry",
     "save_registry",
@@ -6,6 +6,8 @@ can discover peers by name across the machine (no per-cast wiring).
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import json
 import os
 from dataclasses import dataclass
@@ -13,10 +15,6 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
-from ruamel.yaml import YAML
-
-yaml = YAML()
-
 REGISTRY_VERSION = 1
 
 
@@ -28,6 +26,17 @@ def cast_home_dir() -> Path:
     return Path.home() / ".cast"
 
 
+def cast_cache_dir(root: Path) -> Path:
+    """
+    Per-user scratch dir for one Cast root (indexes and similar caches).
+
+    Kept under CAST_HOME rather than the cast's own .cast/, which is usually
+    committed; keyed by the resolved root so separate clones never share it.
+    """
+    key = hashlib.sha1(os.fsencode(Path(root).expanduser().resolve())).hexdigest()[:16]
+    return cast_home_dir() / "cache" / key
+
+
 def registry_path() -> Path:
     """Path to registry JSON."""
     return cast_home_dir() / "registry.json"
@@ -42,16 +51,85 @@ def _empty_registry() -> dict[str, Any]:
     return {"version": REGISTRY_VERSION, "updated_at": "", "casts": {}, "codebases": {}}
 
 
+@functools.cache
+def _get_orjson():
+    """Return the optional orjson codec (cast-core[fast]), or None; looked up on first use."""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(reg: dict[str, Any]) -> bytes:
+    """Encode the registry as indented UTF-8 JSON (orjson when installed)."""
+    orjson = _get_orjson()
+    if orjson is not None:
+        return orjson.dumps(reg, option=orjson.OPT_INDENT_2)
+    return json.dumps(reg, indent=2).encode("utf-8")
+
+
+def _loads(data: bytes) -> dict[str, Any]:
+    orjson = _get_orjson()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
 def load_registry() -> dict[str, Any]:
     path = registry_path()
     if not path.exists():
         path.parent.mkdir(parents=True, exist_ok=True)
         reg = _empty_registry()
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(reg, f, indent=2)
+        path.write_bytes(_dumps(reg))
         return reg
-    with open(path, encoding="utf-8") as f:
-        return json.load(f)
+    return _loads(path.read_bytes())
+
+
+@functools.lru_cache(maxsize=4)
+def _parse_registry(path: str, _mtime_ns: int, _size: int, _ino: int) -> dict[str, Any]:
+    """Parse registry.json; memoized per file version (a save's rename changes the inode)."""
+    with open(path, "rb") as f:
+        return _loads(f.read())
+
+
+@functools.lru_cache(maxsize=4)
+def _index_casts(path: str, mtime_ns: int, size: int, ino: int) -> tuple[dict[str, str], dict[str, str]]:
+    """(name -> cast_id, root -> cast_id) for one registry file version."""
+    by_name: dict[str, str] = {}
+    by_root: dict[str, str] = {}
+    for cid, data in _parse_registry(path, mtime_ns, size, ino).get("casts", {}).items():
+        by_name.setdefault(data.get("name"), cid)
+        by_root.setdefault(data.get("root"), cid)
+    return by_name, by_root
+
+
+def _registry_version() -> tuple[str, int, int, int] | None:
+    """Cache key for the registry file as it is on disk now (None if missing)."""
+    path = registry_path()
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return os.fspath(path), st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _registry_snapshot() -> dict[str, Any]:
+    """
+    Registry for read-only lookups, re-parsed only when the file changes.
+    Shared between callers: never mutate it (use load_registry() before save_registry()).
+    """
+    key = _registry_version()
+    if key is None:
+        return load_registry()
+    return _parse_registry(*key)
+
+
+def _cast_index() -> tuple[dict[str, str], dict[str, str]]:
+    """Name and root lookups over the current registry; shared, never mutate."""
+    key = _registry_version()
+    if key is None:
+        load_registry()
+        key = _registry_version()
+    return _index_casts(*key)
 
 
 def save_registry(reg: dict[str, Any]) -> None:
@@ -60,8 +138,7 @@ def save_registry(reg: dict[str, Any]) -> None:
     reg["updated_at"] = _now_ts()
     path.parent.mkdir(parents=True, exist_ok=True)
     tmp = path.with_name(f".{path.name}.casttmp")
-    with open(tmp, "w", encoding="utf-8") as f:
-        json.dump(reg, f, indent=2)
+    tmp.write_bytes(_dumps(reg))
     tmp.replace(path)
 
 
@@ -87,17 +164,34 @@ class CodebaseEntry:
 
 
 def _read_cast_config(root: Path) -> tuple[str, str]:
-    """Return (cast_id, cast_name) from .cast/config.yaml in root."""
+    """
+    Return (cast_id, cast_name) from .cast/config.yaml in root.
+
+    Reads the raw mapping rather than building a CastConfig; lookups only
+    need these two keys.
+    """
     cfg = root / ".cast" / "config.yaml"
-    if not cfg.exists():
-        raise FileNotFoundError(f"config.yaml not found at: {cfg}")
-    with open(cfg, encoding="utf-8") as f:
-        data = yaml.load(f) or {}
+    try:
+        st = os.stat(cfg)
+    except FileNotFoundError:
+        raise FileNotFoundError(f"config.yaml not found at: {cfg}") from None
+    return _parse_cast_config(os.fspath(cfg), st.st_mtime_ns, st.st_size, st.st_ino)
+
+
+@functools.lru_cache(maxsize=32)
+def _parse_cast_config(path: str, _mtime_ns: int, _size: int, _ino: int) -> tuple[str, str]:
+    """Parse (cast_id, cast_name) from a config.yaml; memoized per file version."""
+    # Read-only load: PyYAML's libyaml-backed loader with YAML 1.2 scalar rules
+    from cast_core.yamlfast import load_yaml
+
+    with open(path, "rb") as f:
+        data = load_yaml(f.read()) or {}
     cast_id = data.get("cast-id")
     cast_name = data.get("cast-name")
-    if not cast_id or not cast_name:
+    if cast_id is None or cast_name is None or cast_id == "" or cast_name == "":
         raise ValueError("config.yaml missing required fields: cast-id/cast-name")
-    return cast_id, cast_name
+    # Registry entries are strings even if the YAML scalar was e.g. a number
+    return str(cast_id), str(cast_name)
 
 
 def register_cast(root: Path) -> CastEntry:
@@ -147,7 +241,7 @@ def _entry_from_reg(cast_id: str, payload: dict[str, Any]) -> CastEntry:
 
 
 def list_casts() -> list[CastEntry]:
-    reg = load_registry()
+    reg = _registry_snapshot()
     out: list[CastEntry] = []
     for cid, data in reg.get("casts", {}).items():
         out.append(_entry_from_reg(cid, data))
@@ -155,7 +249,7 @@ def list_casts() -> list[CastEntry]:
 
 
 def resolve_cast_by_id(cast_id: str) -> CastEntry | None:
-    reg = load_registry()
+    reg = _registry_snapshot()
     data = reg.get("casts", {}).get(cast_id)
     if not data:
         return None
@@ -163,11 +257,10 @@ def resolve_cast_by_id(cast_id: str) -> CastEntry | None:
 
 
 def resolve_cast_by_name(name: str) -> CastEntry | None:
-    reg = load_registry()
-    for cid, data in reg.get("casts", {}).items():
-        if data.get("name") == name:
-            return _entry_from_reg(cid, data)
-    return None
+    cid = _cast_index()[0].get(name)
+    if cid is None:
+        return None
+    return resolve_cast_by_id(cid)
 
 
 def unregister_cast(
@@ -184,17 +277,10 @@ def unregister_cast(
 
     if cast_id and cast_id in casts:
         target_id = cast_id
-    elif name:
-        for cid, data in casts.items():
-            if data.get("name") == name:
-                target_id = cid
-                break
-    elif root:
-        root_str = str(root.expanduser().resolve())
-        for cid, data in casts.items():
-            if data.get("root") == root_str:
-                target_id = cid
-                break
+    elif name or root:
+        # Match within the registry just loaded (a snapshot index would re-read the file)
+        key, want = ("name", name) if name else ("root", str(root.expanduser().resolve()))
+        target_id = next((cid for cid, data in casts.items() if data.get(key) == want), None)
 
     if not target_id:
         return None
@@ -255,7 +341,7 @@ def register_codebase(name: str, root: Path, origin_cast: str | None = None) ->
     return CodebaseEntry(name=name, root=root, origin_cast=origin_cast)
 
 def list_codebases() -> list[CodebaseEntry]:
-    reg = load_registry()
+    reg = _registry_snapshot()
     out: list[CodebaseEntry] = []
     for name, data in reg.get("codebases", {}).items():
         out.append(CodebaseEntry(
@@ -266,7 +352,7 @@ def list_codebases() -> list[CodebaseEntry]:
     return out
 
 def resolve_codebase_by_name(name: str) -> CodebaseEntry | None:
-    reg = load_registry()
+    reg = _registry_snapshot()
     data = reg.get("codebases", {}).get(name)
     if not data:
         return None
@@ -0,0 +1,62 @@
+"""Read-only YAML loading with PyYAML's C loader and YAML 1.2 scalar rules.
+
+Cast files are written by ruamel (YAML 1.2), where bare `on`/`no`/`yes` stay
+strings and `1:20` is not a number. PyYAML resolves scalars per YAML 1.1, so
+its safe loader is used here with the 1.2 core-schema bool/int/float rules.
+"""
+
+from __future__ import annotations
+
+import functools
+import re
+from typing import Any
+
+_BOOL_TAG = "tag:yaml.org,2002:bool"
+_INT_TAG = "tag:yaml.org,2002:int"
+_FLOAT_TAG = "tag:yaml.org,2002:float"
+
+_BOOL_RE = re.compile(r"^(?:true|True|TRUE|false|False|FALSE)$")
+_INT_RE = re.compile(r"^(?:[-+]?[0-9]+|0o[0-7]+|0x[0-9a-fA-F]+)$")
+_FLOAT_RE = re.compile(
+    r"^(?:[-+]?(?:\.[0-9]+|[0-9]+(?:\.[0-9]*)?)(?:[eE][-+]?[0-9]+)?"
+    r"|[-+]?\.(?:inf|Inf|INF)|\.(?:nan|NaN|NAN))$"
+)
+
+
+def _construct_int(loader, node) -> int:
+    value = loader.construct_scalar(node)
+    # Core schema: no 1.1 sexagesimal (1:20), binary or leading-zero octal forms
+    return int(value, 0) if value[:2] in ("0x", "0o") else int(value)
+
+
+def _construct_bool(loader, node) -> bool:
+    return loader.construct_scalar(node).lower() == "true"
+
+
+@functools.cache
+def _loader():
+    import yaml
+
+    base = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+    class Yaml12Loader(base):
+        pass
+
+    # Drop the YAML 1.1 bool/int/float resolvers, keep the rest (null, timestamps, merge)
+    Yaml12Loader.yaml_implicit_resolvers = {
+        first: [(tag, rx) for tag, rx in resolvers if tag not in (_BOOL_TAG, _INT_TAG, _FLOAT_TAG)]
+        for first, resolvers in base.yaml_implicit_resolvers.items()
+    }
+    Yaml12Loader.add_implicit_resolver(_BOOL_TAG, _BOOL_RE, list("tTfF"))
+    Yaml12Loader.add_implicit_resolver(_INT_TAG, _INT_RE, list("-+0123456789"))
+    Yaml12Loader.add_implicit_resolver(_FLOAT_TAG, _FLOAT_RE, list("-+.0123456789"))
+    Yaml12Loader.add_constructor(_BOOL_TAG, _construct_bool)
+    Yaml12Loader.add_constructor(_INT_TAG, _construct_int)
+    return Yaml12Loader
+
+
+def load_yaml(data: bytes | str) -> Any:
+    """Parse one YAML document (read-only use; nothing round-trips through this)."""
+    import yaml
+
+    return yaml.load(data, Loader=_loader())
@@ -145,7 +145,7 @@ class CodebaseSync:
         y = ruamel.yaml.YAML()
         with open(path, encoding="utf-8") as f:
             data = y.load(f)
-        return CastConfig(**data)
+        return CastConfig.model_validate(data)
 
     def _load_syncstate(self) -> SyncState:
         path = self.cast_dir / "syncstate.json"
@@ -158,7 +158,7 @@ class CodebaseSync:
         for cast_id, peers in data.get("baselines", {}).items():
             baselines[cast_id] = {}
             for peer_name, entry in peers.items():
-                baselines[cast_id][peer_name] = SyncStateEntry(**entry)
+                baselines[cast_id][peer_name] = SyncStateEntry.model_validate(entry)
         return SyncState(
             version=data.get("version", 1),
             updated_at=data.get("updated_at", ""),
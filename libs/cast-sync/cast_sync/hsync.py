@@ -104,7 +104,7 @@ class HorizontalSync:
         yaml = ruamel.yaml.YAML()
         with open(config_path, encoding="utf-8") as f:
             data = yaml.load(f)
-        return CastConfig(**data)
+        return CastConfig.model_validate(data)
 
     def _load_syncstate(self) -> SyncState:
         """Load sync state."""
@@ -122,7 +122,7 @@ class HorizontalSync:
         for cast_id, peers in data.get("baselines", {}).items():
             baselines[cast_id] = {}
             for peer_name, entry in peers.items():
-                baselines[cast_id][peer_name] = SyncStateEntry(**entry)
+                baselines[cast_id][peer_name] = SyncStateEntry.model_validate(entry)
 
         return SyncState(
             version=data.get("version", 1),
@@ -169,7 +169,7 @@ class HorizontalSync:
         for cast_id, peers in data.get("baselines", {}).items():
             baselines[cast_id] = {}
             for peer_name, entry in peers.items():
-                baselines[cast_id][peer_name] = SyncStateEntry(**entry)
+                baselines[cast_id][peer_name] = SyncStateEntry.model_validate(entry)
         return SyncState(
             version=data.get("version", 1),
             updated_at=data.get("updated_at", ""),
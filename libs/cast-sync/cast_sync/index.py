@@ -1,7 +1,9 @@
 """Ephemeral index building for casts."""
 
+import json
 import logging
 from pathlib import Path
+from typing import Any
 
 from cast_core import (
     compute_digest,
@@ -15,6 +17,10 @@ from cast_core.yamlio import parse_hsync_entries, reorder_cast_fields
 
 logger = logging.getLogger(__name__)
 
+INDEX_CACHE_VERSION = 1
+# Parsed-record cache file shared by read-only scans (doctor, report, TUI); see index_cache_path()
+INDEX_CACHE_NAME = "index-cache.json"
+
 
 class EphemeralIndex:
     """In-memory index of a cast's files."""
@@ -53,8 +59,49 @@ class EphemeralIndex:
         return codebases
 
 
+def index_cache_path(root_path: Path) -> Path:
+    """Where the index cache for the cast at `root_path` lives (per user, outside the cast)."""
+    from cast_core.registry import cast_cache_dir
+
+    return cast_cache_dir(root_path) / INDEX_CACHE_NAME
+
+
+def _load_index_cache(cache_path: Path, vault_path: Path) -> dict[str, Any]:
+    """Load per-file cache entries (relpath -> {"stat": [mtime_ns, size], "rec": ...})."""
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if (
+        not isinstance(data, dict)
+        or data.get("version") != INDEX_CACHE_VERSION
+        or data.get("vault") != str(vault_path)
+        or not isinstance(data.get("files"), dict)
+    ):
+        return {}
+    return data["files"]
+
+
+def _save_index_cache(cache_path: Path, vault_path: Path, files: dict[str, Any]) -> None:
+    payload = {"version": INDEX_CACHE_VERSION, "vault": str(vault_path), "files": files}
+    tmp = cache_path.with_name(f".{cache_path.name}.casttmp")
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        tmp.replace(cache_path)
+    except (OSError, TypeError, ValueError) as e:
+        tmp.unlink(missing_ok=True)
+        logger.debug(f"Could not write index cache {cache_path}: {e}")
+
+
 def build_ephemeral_index(
-    root_path: Path, vault_path: Path, fixup: bool = True, limit_file: str | None = None
+    root_path: Path,
+    vault_path: Path,
+    fixup: bool = True,
+    limit_file: str | None = None,
+    cache_path: Path | None = None,
 ) -> EphemeralIndex:
     """
     Build an ephemeral index of cast files in a cast folder.
@@ -64,6 +111,9 @@ def build_ephemeral_index(
         vault_path: Path to cast folder
         fixup: Whether to fix missing cast-id and reorder fields
         limit_file: Optional cast-id or relpath to limit indexing to one file
+        cache_path: Optional JSON file that keeps parsed records keyed by each file's
+            (mtime_ns, size); unchanged files are not re-parsed. Only used for
+            read-only full scans (fixup=False, no limit_file).
 
     Returns:
         EphemeralIndex instance
@@ -102,7 +152,29 @@ def build_ephemeral_index(
     else:
         md_files = list(vault_path.rglob("*.md"))
 
+    use_cache = cache_path is not None and not fixup and not limit_file
+    cached: dict[str, Any] = _load_index_cache(cache_path, vault_path) if use_cache else {}
+    fresh: dict[str, Any] = {}
+
     for md_path in md_files:
+        stat_key = None
+        if use_cache:
+            relpath = str(md_path.relative_to(vault_path))
+            try:
+                st = md_path.stat()
+                stat_key = [st.st_mtime_ns, st.st_size]
+            except OSError:
+                stat_key = None
+            hit = cached.get(relpath)
+            if stat_key is not None and isinstance(hit, dict) and hit.get("stat") == stat_key:
+                fresh[relpath] = hit
+                if hit.get("rec"):
+                    index.add_file(hit["rec"])
+                continue
+            if stat_key is not None:
+                # Recorded as "not a cast file" unless a record is built below
+                fresh[relpath] = {"stat": stat_key, "rec": None}
+
         try:
             # Parse file
             front_matter, body, has_cast_fields = parse_cast_file(md_path)
@@ -177,6 +249,8 @@ def build_ephemeral_index(
             }
 
             index.add_file(rec)
+            if stat_key is not None:
+                fresh[relpath] = {"stat": stat_key, "rec": rec}
 
             # If we were looking for a specific file by cast-id
             if limit_file and cast_id == limit_file:
@@ -184,6 +258,11 @@ def build_ephemeral_index(
 
         except Exception as e:
             logger.warning(f"Error indexing {md_path}: {e}")
+            if stat_key is not None:
+                fresh.pop(relpath, None)  # retry next time rather than caching the failure
             continue
 
+    if use_cache and fresh != cached:
+        _save_index_cache(cache_path, vault_path, fresh)
+
     return index
@@ -8,7 +8,7 @@ from dataclasses import dataclass
 from pathlib import Path
 
 import ruamel.yaml
-from cast_cli.cli import app
+from cast_cli.cli import _root_for, app
 from typer.testing import CliRunner
 
 from .files import read_file, write_file  # re-exported in __init__
@@ -63,6 +63,7 @@ class Sandbox:
         self._vaults: list[VaultRef] = []
         self.env = os.environ.copy()
         self.env["CAST_HOME"] = str(self.cast_home)
+        self.env["CAST_ROOT"] = None  # CliRunner unsets None-valued variables
 
     # --- CLI helpers --------------------------------------------------------
     def run(
@@ -74,6 +75,8 @@ class Sandbox:
         tolerate_conflict: bool = True,
     ):
         """Invoke the Typer CLI like the shell would."""
+        # Each shell invocation is a fresh process; drop the per-process root cache.
+        _root_for.cache_clear()
         if chdir:
             with cwd(chdir):
                 res = self.runner.invoke(app, args, env=self.env, input=input)
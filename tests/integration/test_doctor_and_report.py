@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import json
+
 from tests.framework import Sandbox, mk_note, write_file
 
 
@@ -23,3 +25,32 @@ def test_doctor_and_report(tmp_path):
         # Note: JSON parsing might fail due to control characters, so check if we have files
         if data["file_list"]:  # Only check if file list is not empty (not mocked)
             assert any(x["path"].endswith("r.md") for x in data["file_list"])
+
+
+def test_cast_root_env_overrides_cwd(tmp_path):
+    with Sandbox(tmp_path) as sb:
+        vault = sb.create_vault("Alpha")
+        sb.env["CAST_ROOT"] = str(vault.root)
+        # Run from outside any Cast; CAST_ROOT still locates Alpha
+        res = sb.run(["report"], chdir=tmp_path)
+        assert json.loads(res.stdout)["cast_dir"] == str(vault.root / "Cast")
+
+
+def test_doctor_survives_symlink_loop(tmp_path):
+    with Sandbox(tmp_path) as sb:
+        vault = sb.create_vault("Alpha")
+        # Folder symlinks pointing back up the tree must not be walked (each one doubles the tree)
+        for name in ("a", "b", "c"):
+            (vault.root / "Cast" / name).symlink_to(vault.root, target_is_directory=True)
+        assert sb.doctor(vault) in (0, 1)
+
+
+def test_doctor_checks_symlinked_notes(tmp_path):
+    with Sandbox(tmp_path) as sb:
+        vault = sb.create_vault("Alpha")
+        # The only note is a symlink; doctor must still index it and flag its unknown peer
+        target = tmp_path / "outside.md"
+        write_file(target, mk_note("88888888-8888-8888-8888-888888888888", "S", "b", peers=["Ghost"]))
+        (vault.root / "Cast" / "linked.md").symlink_to(target)
+        res = sb.run(["doctor"], chdir=vault.root)
+        assert "Ghost" in res.stdout
@@ -303,3 +303,139 @@ def test_delete_peer_pulls_delete_locally(env, tmp_path: Path):
     assert not (root1 / rel).exists(), "local file should be deleted after peer deletion"
     state = json.loads((root1 / ".cast" / "syncstate.json").read_text(encoding="utf-8"))
     assert cid not in state.get("baselines", {}), "baseline should be cleared after pulled deletion"
+
+
+@pytest.mark.parametrize(
+    "name",
+    [
+        "key: value",
+        "note #1",
+        "-leading-dash",
+        'say "hi"',
+        "it's",
+        "yes",
+        "null",
+        "~",
+        "123",
+        "[list]",
+        "*alias",
+        "café ☕",
+        "tab\there",
+        "del\x7f and nel\x85 inside",
+    ],
+)
+def test_init_config_round_trips_name(env, tmp_path: Path, monkeypatch, name):
+    import uuid
+
+    import yaml
+
+    monkeypatch.chdir(tmp_path)
+    res = runner.invoke(app, ["init", "--no-install", "--name", name], env=env)
+    assert res.exit_code == 0, res.output
+
+    cfg = yaml.safe_load((tmp_path / ".cast" / "config.yaml").read_text(encoding="utf-8"))
+    assert cfg["cast-name"] == name
+    assert cfg["cast-version"] == 1
+    assert str(uuid.UUID(cfg["cast-id"])) == cfg["cast-id"]
+
+
+def _init_casts(env, tmp_path: Path, monkeypatch, *names: str) -> dict[str, Path]:
+    roots = {}
+    for name in names:
+        root = tmp_path / name
+        root.mkdir()
+        monkeypatch.chdir(root)
+        res = runner.invoke(app, ["init", "--name", name], env=env)
+        assert res.exit_code == 0, res.output
+        roots[name] = root
+    monkeypatch.chdir(tmp_path)
+    return roots
+
+
+def _installed(env) -> dict[str, dict]:
+    res = runner.invoke(app, ["list", "--json"], env=env)
+    assert res.exit_code == 0, res.output
+    return {c["name"]: c for c in json.loads(res.stdout)["casts"]}
+
+
+def test_uninstall_by_name_id_and_path(env, tmp_path: Path, monkeypatch):
+    roots = _init_casts(env, tmp_path, monkeypatch, "alpha", "beta", "gamma")
+    beta_id = _installed(env)["beta"]["cast_id"]
+
+    res = runner.invoke(app, ["uninstall", "alpha"], env=env)
+    assert res.exit_code == 0, res.output
+    assert set(_installed(env)) == {"beta", "gamma"}
+
+    res = runner.invoke(app, ["uninstall", beta_id], env=env)
+    assert res.exit_code == 0, res.output
+    assert set(_installed(env)) == {"gamma"}
+
+    res = runner.invoke(app, ["uninstall", str(roots["gamma"])], env=env)
+    assert res.exit_code == 0, res.output
+    assert _installed(env) == {}
+
+
+def test_uninstall_unknown_name(env, tmp_path: Path, monkeypatch):
+    _init_casts(env, tmp_path, monkeypatch, "alpha")
+
+    res = runner.invoke(app, ["uninstall", "nope"], env=env)
+    assert res.exit_code == 2
+    assert "No installed cast matched 'nope'" in res.output
+    assert set(_installed(env)) == {"alpha"}
+
+
+@pytest.mark.parametrize("backend", ["orjson", "stdlib"])
+def test_json_bytes_identical_across_backends(monkeypatch, backend):
+    from cast_cli import cli
+
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(cli, "_get_orjson", lambda: None)
+    obj = {"name": "café", "ids": [1, 2], "empty": {}, "root": None}
+    assert cli._json_bytes(obj, indent=False) == (
+        '{"name":"café","ids":[1,2],"empty":{},"root":null}'.encode()
+    )
+    assert cli._json_bytes(obj) == (
+        '{\n  "name": "café",\n  "ids": [\n    1,\n    2\n  ],\n  "empty": {},\n  "root": null\n}'
+    ).encode()
+
+
+def test_list_piped_output_is_tsv(env, tmp_path: Path, monkeypatch):
+    res = runner.invoke(app, ["list"], env=env)
+    assert res.exit_code == 0, res.output
+    assert res.stdout == ""
+    assert res.stderr == "No casts installed\n"
+
+    roots = _init_casts(env, tmp_path, monkeypatch, "alpha", "beta")
+    res = runner.invoke(app, ["list"], env=env)
+    assert res.exit_code == 0, res.output
+    assert sorted(res.stdout.splitlines()) == [
+        f"alpha\t{roots['alpha'].resolve()}",
+        f"beta\t{roots['beta'].resolve()}",
+    ]
+
+    ids = {name: c["cast_id"] for name, c in _installed(env).items()}
+    res = runner.invoke(app, ["list", "--ids"], env=env)
+    assert sorted(res.stdout.splitlines()) == [
+        f"{name}\t{ids[name]}\t{roots[name].resolve()}" for name in ("alpha", "beta")
+    ]
+
+
+def test_install_keeps_yaml12_string_names(env, tmp_path: Path, monkeypatch):
+    # ruamel writes YAML 1.2, where a bare `on` is a string, not a boolean
+    (tmp_path / ".cast").mkdir()
+    (tmp_path / "Cast").mkdir()
+    (tmp_path / ".cast" / "config.yaml").write_text(
+        "cast-version: 1\ncast-id: 33333333-3333-3333-3333-333333333333\ncast-name: on\n",
+        encoding="utf-8",
+    )
+    monkeypatch.chdir(tmp_path)
+    res = runner.invoke(app, ["install", "."], env=env)
+    assert res.exit_code == 0, res.output
+    assert "Installed cast: on" in res.output
+
+    res = runner.invoke(app, ["list"], env=env)
+    assert res.exit_code == 0, res.output
+    assert res.stdout.startswith("on\t")
+    assert set(_installed(env)) == {"on"}
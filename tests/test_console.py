@@ -0,0 +1,12 @@
+"""Test the plain-text path the shared CLI console takes when output is piped."""
+
+from cast_cli.console import console
+
+
+def test_piped_print_strips_only_style_markup(capsys):
+    console.print("[green][OK][/green] Updated [bold cyan]Cast/[note] plan.md[/bold cyan]")
+    console.print("[red]Error:[/red] tag \\[red] and [x y] stay [/]")
+    assert capsys.readouterr().out == (
+        "[OK] Updated Cast/[note] plan.md\n"
+        "Error: tag [red] and [x y] stay \n"
+    )
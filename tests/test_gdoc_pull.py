@@ -0,0 +1,118 @@
+"""Test that `cast gdoc pull` skips the export only when neither side changed."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+from cast_cli import gdoc
+from cast_cli.cli import app
+from typer.testing import CliRunner
+
+runner = CliRunner()
+
+
+class _Request:
+    def __init__(self, fn):
+        self._fn = fn
+
+    def execute(self):
+        return self._fn()
+
+
+class _FakeGoogle:
+    """Stands in for both the Drive and Docs services."""
+
+    def __init__(self):
+        self.revision = "rev-1"
+        self.markdown = "Remote body v1\n"
+        self.exports = 0
+
+    # Docs: documents().get(documentId=..., fields="revisionId").execute()
+    def documents(self):
+        return self
+
+    def get(self, documentId, fields=None):  # noqa: N803
+        return _Request(lambda: {"revisionId": self.revision})
+
+    # Drive: files().export(fileId=..., mimeType=...).execute()
+    def files(self):
+        return self
+
+    def export(self, fileId, mimeType):  # noqa: N803
+        def run():
+            self.exports += 1
+            return self.markdown.encode("utf-8")
+
+        return _Request(run)
+
+
+@pytest.fixture()
+def cast(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAST_HOME", str(tmp_path / "home"))
+    monkeypatch.setenv("CAST_ROOT", str(tmp_path))
+    (tmp_path / ".cast").mkdir()
+    (tmp_path / ".cast" / "config.yaml").write_text(
+        "cast-version: 1\ncast-id: id-root\ncast-name: Alpha\n", encoding="utf-8"
+    )
+    note = tmp_path / "Cast" / "(GDoc) Plan.md"
+    note.parent.mkdir()
+    note.write_text(
+        "---\ncast-id: id-note\nurl: https://docs.google.com/document/d/DOC123/edit\n---\nold\n",
+        encoding="utf-8",
+    )
+    google = _FakeGoogle()
+    monkeypatch.setattr(gdoc, "_build_services", lambda root: (google, google))
+    # The real fetch builds an authorized transport; the fake request runs directly
+    monkeypatch.setattr(gdoc, "_fetch_revision_id", lambda req: req.execute().get("revisionId"))
+    return note, google
+
+
+def _pull(note: Path, *extra: str):
+    res = runner.invoke(app, ["gdoc", "pull", *extra, str(note)])
+    assert res.exit_code == 0, res.output
+    return res
+
+
+def test_unchanged_revision_skips_export(cast):
+    note, google = cast
+    _pull(note)
+    assert google.exports == 1
+    assert "Remote body v1" in note.read_text(encoding="utf-8")
+
+    res = _pull(note)
+    assert google.exports == 1
+    assert "Up to date" in res.output
+
+
+def test_changed_revision_exports(cast):
+    note, google = cast
+    _pull(note)
+    google.revision, google.markdown = "rev-2", "Remote body v2\n"
+
+    _pull(note)
+    assert google.exports == 2
+    assert "Remote body v2" in note.read_text(encoding="utf-8")
+
+
+def test_locally_modified_note_exports(cast):
+    note, google = cast
+    _pull(note)
+    st = note.stat()
+    note.write_text(note.read_text(encoding="utf-8") + "local edit\n", encoding="utf-8")
+    os.utime(note, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+
+    _pull(note)
+    assert google.exports == 2
+    assert "local edit" not in note.read_text(encoding="utf-8")
+
+
+def test_force_exports_unchanged(cast):
+    note, google = cast
+    _pull(note)
+    _pull(note, "--force")
+    assert google.exports == 2
+    # The forced pull records the revision again, so a plain pull skips once more
+    _pull(note)
+    assert google.exports == 2
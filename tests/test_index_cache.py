@@ -0,0 +1,54 @@
+"""Test the mtime-keyed cache used by read-only index builds."""
+
+import json
+import os
+
+from cast_sync import build_ephemeral_index
+from cast_sync.index import _save_index_cache, index_cache_path
+
+
+def _note(cast_id: str, peer: str) -> str:
+    return f"---\ncast-id: {cast_id}\ncast-hsync:\n- {peer} (live)\ncast-version: 1\n---\nBody\n"
+
+
+def test_index_cache_reuses_and_invalidates(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAST_HOME", str(tmp_path / "home"))
+    vault = tmp_path / "Cast"
+    vault.mkdir()
+    (tmp_path / ".cast").mkdir()
+    cache = index_cache_path(tmp_path)
+    note = vault / "a.md"
+    note.write_text(_note("id-a", "Beta"), encoding="utf-8")
+    (vault / "plain.md").write_text("no front matter\n", encoding="utf-8")
+
+    idx = build_ephemeral_index(tmp_path, vault, fixup=False, cache_path=cache)
+    assert idx.all_peers() == {"Beta"}
+    files = json.loads(cache.read_text(encoding="utf-8"))["files"]
+    assert files["a.md"]["rec"]["cast_id"] == "id-a"
+    assert files["plain.md"]["rec"] is None
+    # Machine-specific: lives under CAST_HOME, never in the (committed) .cast folder
+    assert cache.is_relative_to(tmp_path / "home")
+    assert list((tmp_path / ".cast").iterdir()) == []
+
+    # Cached records are served without re-parsing
+    again = build_ephemeral_index(tmp_path, vault, fixup=False, cache_path=cache)
+    assert again.by_id == idx.by_id
+
+    # Editing the file (new size / mtime) invalidates its entry
+    note.write_text(_note("id-a", "Gamma-Peer"), encoding="utf-8")
+    st = note.stat()
+    os.utime(note, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    changed = build_ephemeral_index(tmp_path, vault, fixup=False, cache_path=cache)
+    assert changed.all_peers() == {"Gamma-Peer"}
+
+    # Deleted files drop out of the cache
+    note.unlink()
+    gone = build_ephemeral_index(tmp_path, vault, fixup=False, cache_path=cache)
+    assert gone.by_id == {}
+    assert "a.md" not in json.loads(cache.read_text(encoding="utf-8"))["files"]
+
+
+def test_index_cache_failed_write_leaves_no_temp_file(tmp_path):
+    cache = tmp_path / "cache" / "index-cache.json"
+    _save_index_cache(cache, tmp_path, {"a.md": {"rec": object()}})
+    assert list(cache.parent.iterdir()) == []
@@ -0,0 +1,42 @@
+"""Test that the registry's parse caches follow writes made in the same process."""
+
+from cast_core.registry import list_casts, register_cast, resolve_cast_by_name, unregister_cast
+
+
+def _make_cast(root, cast_id: str, name: str):
+    (root / ".cast").mkdir(parents=True)
+    (root / "Cast").mkdir()
+    cfg = root / ".cast" / "config.yaml"
+    cfg.write_text(f"cast-version: 1\ncast-id: {cast_id}\ncast-name: {name}\n", encoding="utf-8")
+    return cfg
+
+
+def test_registry_reads_follow_saves(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAST_HOME", str(tmp_path / "home"))
+    assert list_casts() == []
+
+    cfg = _make_cast(tmp_path / "a", "id-a", "Alpha")
+    register_cast(tmp_path / "a")
+    assert [e.name for e in list_casts()] == ["Alpha"]
+
+    # A renamed config (new content) is re-read on the next registration
+    cfg.write_text("cast-version: 1\ncast-id: id-a\ncast-name: Alpha2\n", encoding="utf-8")
+    register_cast(tmp_path / "a")
+    assert resolve_cast_by_name("Alpha") is None
+    assert resolve_cast_by_name("Alpha2").cast_id == "id-a"
+
+    unregister_cast(cast_id="id-a")
+    assert list_casts() == []
+
+
+def test_unregister_by_name_and_root(tmp_path, monkeypatch):
+    monkeypatch.setenv("CAST_HOME", str(tmp_path / "home"))
+    _make_cast(tmp_path / "a", "id-a", "Alpha")
+    _make_cast(tmp_path / "b", "id-b", "Beta")
+    register_cast(tmp_path / "a")
+    register_cast(tmp_path / "b")
+
+    assert unregister_cast(name="Alpha").cast_id == "id-a"
+    assert unregister_cast(name="Alpha") is None
+    assert unregister_cast(root=tmp_path / "b").cast_id == "id-b"
+    assert list_casts() == []